@@ -4,6 +4,6 @@ __version__ = "1.0.0"
 
 from ._server import Server
 from ._client import Client
-from ._base import ReverseTokenResult, set_log_level
+from ._base import ReverseTokenResult, set_default_buffer_size, set_log_level
 
-__all__ = ["Server", "Client", "ReverseTokenResult", "set_log_level"]
\ No newline at end of file
+__all__ = ["Server", "Client", "ReverseTokenResult", "set_log_level", "set_default_buffer_size"]
\ No newline at end of file
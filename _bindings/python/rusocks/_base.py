@@ -6,11 +6,17 @@ This module contains shared functionality used by Server and Client classes.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import logging
+import os
+import re
 import asyncio
+import contextvars
 import threading
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, List
@@ -18,51 +24,244 @@ from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, List
 # Underlying Rust bindings module (generated)
 from rusockslib import rusocks # type: ignore
 
+# Optional faster JSON decoder for the Rust log path; accepts both str and bytes
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+_json_loads: Callable[[Union[str, bytes]], Any] = _orjson.loads if _orjson is not None else json.loads
+
 _logger = logging.getLogger(__name__)
 
+
+def _secs_times_second(secs: Union[int, float]) -> Any:
+    # Fallback for bindings without duration_from_secs_f64
+    return secs * rusocks.SECOND
+
+
+# Duration converters, bound once for the option-setting paths. Only the
+# pure-Python shim provides duration_from_secs_f64 so far.
+_duration_from_secs: Callable[[Union[int, float]], Any] = (
+    getattr(rusocks, "duration_from_secs_f64", None) or _secs_times_second
+)
+_parse_duration = rusocks.parse_duration
+
+class _Nanoseconds(int):
+    """A duration already converted to nanoseconds; _to_duration passes it through.
+
+    Keeps parsed values (e.g. CLI arguments) apart from bare ints, which mean seconds.
+    """
+
+    __slots__ = ()
+
+
 # Type aliases
 DurationLike = Union[int, float, timedelta, str]
 
 
+@functools.lru_cache(maxsize=1024)
 def _snake_to_camel(name: str) -> str:
     """Convert snake_case to CamelCase."""
     parts = name.split("_")
     return "".join(p.capitalize() for p in parts if p)
 
 
+# Zero-width match before every uppercase letter except a leading one
+_camel_boundary = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def _camel_to_snake(name: str) -> str:
     """Convert CamelCase to snake_case."""
-    out: List[str] = []
-    for ch in name:
-        if ch.isupper() and out:
-            out.append("_")
-        out.append(ch.lower())
-    return "".join(out)
+    return _camel_boundary.sub("_", name).lower()
 
 
-def _to_duration(value: Optional[DurationLike]) -> Any:
-    """Convert seconds/str/timedelta to Rust time.Duration via bindings.
-    
-    - None -> 0
-    - int/float -> seconds (supports fractions)
-    - timedelta -> total seconds
-    - str -> parsed by Rust (e.g., "1.5s", "300ms")
-    """
+def _to_duration_impl(value: Optional[DurationLike]) -> Any:
+    """Uncached conversion behind _to_duration."""
     if value is None:
         return 0
     if isinstance(value, timedelta):
-        seconds = value.total_seconds()
-        return seconds * rusocks.SECOND
+        return _duration_from_secs(value.total_seconds())
     if isinstance(value, (int, float)):
-        return value * rusocks.SECOND
+        return _duration_from_secs(value)
     if isinstance(value, str):
         try:
-            return rusocks.parse_duration(value)
+            return _parse_duration(value)
         except Exception as exc:
             raise ValueError(f"Invalid duration string: {value}") from exc
     raise TypeError(f"Unsupported duration type: {type(value)!r}")
 
 
+@functools.lru_cache(maxsize=128)
+def _to_duration_cached(value: DurationLike) -> Any:
+    return _to_duration_impl(value)
+
+
+def _to_duration(value: Optional[DurationLike]) -> Any:
+    """Convert seconds/str/timedelta to Rust time.Duration via bindings.
+    
+    - None -> 0
+    - int/float -> seconds (supports fractions)
+    - timedelta -> total seconds
+    - str -> parsed by Rust (e.g., "1.5s", "300ms")
+    - _Nanoseconds -> returned unchanged
+
+    Results are cached, since the same timeout constants recur across instances.
+    """
+    if type(value) is _Nanoseconds:
+        # Checked before the cache, where it would collide with the equal int
+        return int(value)
+    if isinstance(value, (int, float, timedelta, str)):
+        return _to_duration_cached(value)
+    return _to_duration_impl(value)
+
+
+# The Rust runtime is process-wide; initialise it once instead of per instance
+_RUNTIME_INITED: bool = False
+_RUNTIME_LOCK = threading.Lock()
+
+
+def _ensure_runtime() -> None:
+    """Initialise the global Rust runtime on first use."""
+    global _RUNTIME_INITED
+    if _RUNTIME_INITED:
+        return
+    with _RUNTIME_LOCK:
+        if _RUNTIME_INITED:
+            return
+        rusocks.init_global_runtime()
+        _RUNTIME_INITED = True
+
+
+# Relay buffer size used when a Client/Server is created without buffer_size.
+# The Rust core defaults to 8 KiB; 32 KiB copies sustain far higher throughput.
+_DEFAULT_BUFFER_SIZE: int = 32 * 1024
+
+
+def set_default_buffer_size(size: int) -> None:
+    """Set the buffer size applied to new Client/Server instances that do not pass one."""
+    global _DEFAULT_BUFFER_SIZE
+    size = int(size)
+    if size <= 0:
+        raise ValueError(f"Buffer size must be positive: {size}")
+    _DEFAULT_BUFFER_SIZE = size
+
+
+# SO_SNDBUF/SO_RCVBUF requested when a Client/Server leaves them unset; an
+# explicit 0 keeps the kernel default
+_DEFAULT_SOCKET_BUFFER: int = 1024 * 1024
+
+
+# (option name, coercer) pairs describing how constructor kwargs map onto a
+# Rust options object; a coercer of None assigns the value unchanged
+OptionFields = Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]
+
+
+def _compile_option_setter(fields: OptionFields, name: str) -> Callable[[Any, Dict[str, Any]], None]:
+    """Generate ``name(opt, values)`` with one inlined None-check and assignment per field.
+
+    Equivalent to looping over ``fields``, but the table is interpreted once at
+    import time instead of on every construction.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = [f"def {name}(opt, values):"]
+    for index, (field, coerce) in enumerate(fields):
+        if not field.isidentifier():
+            raise ValueError(f"Invalid option field name: {field!r}")
+        lines.append(f"    value = values[{field!r}]")
+        lines.append("    if value is not None:")
+        if coerce is None:
+            lines.append(f"        opt.{field} = value")
+        else:
+            namespace[f"_coerce_{index}"] = coerce
+            lines.append(f"        opt.{field} = _coerce_{index}(value)")
+    if len(lines) == 1:
+        lines.append("    pass")
+    exec(compile("\n".join(lines), f"<rusocks {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _blocking_threads() -> int:
+    """Worker count for _BLOCKING_EXEC: RUSOCKS_BLOCKING_THREADS, else asyncio's default."""
+    default = min(32, (os.cpu_count() or 1) + 4)
+    value = os.environ.get("RUSOCKS_BLOCKING_THREADS")
+    if not value:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        _logger.warning("Ignoring invalid RUSOCKS_BLOCKING_THREADS=%r; using %d", value, default)
+        return default
+    return workers
+
+
+# Shared pool for short blocking Rust calls made by the async wrappers (close,
+# add_connector, ...). Waits with no upper bound run on their own thread via
+# _run_blocking_wait so they cannot starve these calls.
+_BLOCKING_EXEC = ThreadPoolExecutor(
+    max_workers=_blocking_threads(),
+    thread_name_prefix="rusocks-blk",
+)
+atexit.register(_BLOCKING_EXEC.shutdown, wait=False)
+
+
+async def _run_in_executor(executor: Executor, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call in ``executor``, like asyncio.to_thread.
+
+    The context copy is only entered when it actually carries variables.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if ctx:
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+    elif kwargs:
+        call = functools.partial(func, *args, **kwargs)
+    else:
+        return await loop.run_in_executor(executor, func, *args)
+    return await loop.run_in_executor(executor, call)
+
+
+async def _run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call in the shared rusocks pool."""
+    return await _run_in_executor(_BLOCKING_EXEC, func, *args, **kwargs)
+
+
+async def _run_blocking_wait(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a call that may block indefinitely (e.g. wait_ready) on a dedicated thread.
+
+    Keeps unbounded waits out of every executor, so pool workers stay free for
+    the close() calls that cancellation paths depend on.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    ctx = contextvars.copy_context()
+
+    def _deliver(result: Any, exc: Optional[BaseException]) -> None:
+        if future.cancelled():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _target() -> None:
+        try:
+            outcome = (ctx.run(func, *args), None)
+        except BaseException as exc:
+            outcome = (None, exc)
+        try:
+            loop.call_soon_threadsafe(_deliver, *outcome)
+        except RuntimeError:
+            # The loop closed while we were blocked; nobody is waiting any more
+            pass
+
+    threading.Thread(target=_target, name="rusocks-wait", daemon=True).start()
+    return await future
+
+
 # Shared Rust->Python log dispatcher
 _def_level_map = {
     "trace": logging.DEBUG,
@@ -75,26 +274,43 @@ _def_level_map = {
     "panic": logging.CRITICAL,
 }
 
+# Structured records carry Rust's log::Level discriminant; index 0 is unused
+_rust_level_table: Tuple[int, ...] = (
+    logging.INFO,
+    logging.ERROR,  # 1: error
+    logging.WARNING,  # 2: warn
+    logging.INFO,  # 3: info
+    logging.DEBUG,  # 4: debug
+    logging.DEBUG,  # 5: trace
+)
+
 
-def _emit_rust_log(py_logger: logging.Logger, line: str) -> None:
-    """Process a Rust log line and emit it to the Python logger."""
+# Keys of a JSON log line that are not forwarded as extras
+_log_reserved_keys = frozenset(("level", "time", "message", "msg"))
+
+
+def _emit_rust_log(py_logger: logging.Logger, line: Union[str, bytes]) -> None:
+    """Process a JSON-encoded Rust log line (legacy format) and emit it to the Python logger.
+
+    The line may be str or raw UTF-8 bytes; both are handed to the decoder as-is.
+    """
     try:
-        obj = json.loads(line)
+        obj = _json_loads(line)
     except Exception:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode("utf-8", "replace")
         py_logger.info(line)
         return
     level = str(obj.get("level", "")).lower()
     message = obj.get("message") or obj.get("msg") or ""
-    extras: Dict[str, Any] = {}
-    for k, v in obj.items():
-        if k in ("level", "time", "message", "msg"):
-            continue
-        extras[k] = v
+    extras = {k: v for k, v in obj.items() if k not in _log_reserved_keys}
     py_logger.log(_def_level_map.get(level, logging.INFO), message, extra={"rust": extras})
 
 
 # Global registry for logger instances
 _logger_registry: Dict[str, logging.Logger] = {}
+# Bumped on every registry change so the listener knows to drop its resolved-logger cache
+_registry_generation: int = 0
 
 # Event-driven log monitoring system
 _log_listeners: List[Callable[[List], None]] = []
@@ -107,13 +323,26 @@ def _start_log_listener() -> None:
     global _listener_thread, _listener_active
     if _listener_active and _listener_thread and _listener_thread.is_alive():
         return
+    if _listener_thread is not None and _listener_thread is not threading.current_thread():
+        # A stopped listener exits on its next wait (cancellation is sticky);
+        # let it finish before clearing the cancel so it cannot block again
+        _listener_thread.join(timeout=1)
+    reset_waiters = getattr(rusocks, "reset_log_waiters", None)
+    if reset_waiters is not None:
+        reset_waiters()
     _listener_active = True
 
     def _run() -> None:
-        # Drain loop: wait for entries with timeout to allow graceful shutdown
+        wait_for_entries = rusocks.wait_for_log_entries
+        # logger_id -> resolved Python logger, valid for one registry generation
+        resolved: Dict[Any, logging.Logger] = {}
+        generation = _registry_generation
+
+        # Drain loop: block until entries arrive; _stop_log_listener() wakes us via
+        # cancel_log_waiters(), which stays set until the next _start_log_listener()
         while _listener_active:
             try:
-                entries = rusocks.wait_for_log_entries(2000)  # wait up to 2s
+                entries = wait_for_entries(0)  # no timeout
             except Exception:
                 # Backoff on unexpected errors to avoid busy loop
                 time.sleep(0.2)
@@ -122,22 +351,34 @@ def _start_log_listener() -> None:
             if not entries:
                 continue
 
-            # Iterate returned entries; handle both attr and dict styles
-            for entry in entries:
-                try:
-                    logger_id = getattr(entry, "logger_id", None)
-                    if logger_id is None and isinstance(entry, dict):
-                        logger_id = entry.get("logger_id")
-
-                    message = getattr(entry, "message", None)
-                    if message is None and isinstance(entry, dict):
-                        message = entry.get("message")
+            if generation != _registry_generation:
+                generation = _registry_generation
+                resolved.clear()
 
-                    if not message:
-                        continue
-
-                    py_logger = _logger_registry.get(str(logger_id)) or _logger
-                    _emit_rust_log(py_logger, str(message))
+            # Entries share a fixed dict schema: logger_id, level, message, fields.
+            # A bad entry is skipped without abandoning the rest of the batch.
+            pending = iter(entries)
+            while True:
+                try:
+                    for entry in pending:
+                        message = entry["message"]
+                        if not message:
+                            continue
+                        logger_id = entry["logger_id"]
+                        py_logger = resolved.get(logger_id)
+                        if py_logger is None:
+                            py_logger = _logger_registry.get(str(logger_id)) or _logger
+                            resolved[logger_id] = py_logger
+                        level = entry.get("level")
+                        if level is None:
+                            # Older bindings hand over a JSON-encoded line
+                            _emit_rust_log(py_logger, message)
+                            continue
+                        py_level = _rust_level_table[level] if 0 < level < len(_rust_level_table) else logging.INFO
+                        if not py_logger.isEnabledFor(py_level):
+                            continue
+                        py_logger.log(py_level, message, extra={"rust": entry["fields"]})
+                    break
                 except Exception:
                     # Never let logging path crash the listener
                     continue
@@ -159,6 +400,8 @@ def _stop_log_listener() -> None:
 
 class BufferZerologLogger:
     """Buffer-based logger system for Rust bindings."""
+
+    __slots__ = ("py_logger", "logger_id", "rust_logger")
     
     def __init__(self, py_logger: logging.Logger, logger_id: str):
         self.py_logger = py_logger
@@ -168,17 +411,67 @@ class BufferZerologLogger:
 
         # Create a new Rust logger with ID
         self.rust_logger = rusocks.PythonLogger.new(self.logger_id)
+        global _registry_generation
         _logger_registry[logger_id] = py_logger
+        _registry_generation += 1
     
     def cleanup(self):
         """Clean up logger resources."""
-        if self.logger_id in _logger_registry:
-            del _logger_registry[self.logger_id]
+        global _registry_generation
+        if _logger_registry.pop(self.logger_id, None) is not None:
+            _registry_generation += 1
+
+
+# Only the pure-Python shim exposes null_logger so far; without it a disabled
+# logger goes through the normal buffered path and its level drops the records
+_null_rust_logger: Optional[Callable[[], Any]] = getattr(rusocks, "null_logger", None)
+
+
+class _NullManagedLogger:
+    """Stand-in for BufferZerologLogger when the Python logger discards everything."""
+
+    __slots__ = ("py_logger", "logger_id", "rust_logger")
+
+    def __init__(self, py_logger: logging.Logger, logger_id: str):
+        self.py_logger = py_logger
+        self.logger_id = logger_id
+        self.rust_logger = _null_rust_logger()
+
+    def cleanup(self):
+        """Nothing to release."""
+
+
+def _managed_logger_for(py_logger: logging.Logger, logger_id: str) -> Union[BufferZerologLogger, _NullManagedLogger]:
+    """Return a buffered logger for ``py_logger``, or a null sink if it is disabled.
+
+    Rust records map to ERROR at most, so a logger that drops ERROR would drop
+    all of them. The check happens once, at construction.
+    """
+    if _null_rust_logger is None or py_logger.isEnabledFor(logging.ERROR):
+        return BufferZerologLogger(py_logger, logger_id)
+    return _NullManagedLogger(py_logger, logger_id)
+
+
+def _release_handles(raw: Any, managed_logger: Any, executor: Optional[Executor] = None) -> None:
+    """weakref.finalize callback for a Client/Server that was never closed."""
+    try:
+        raw.close()
+    except Exception:
+        pass
+    try:
+        managed_logger.cleanup()
+    except Exception:
+        pass
+    if executor is not None and executor is not _BLOCKING_EXEC:
+        executor.shutdown(wait=False)
 
 
 @dataclass
 class ReverseTokenResult:
     """Result of adding a reverse token."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10+
+    __slots__ = ("token", "port")
+
     token: str
     port: int
 
@@ -187,15 +480,27 @@ class _SnakePassthrough:
     """Mixin to map snake_case attribute access to underlying CamelCase.
     
     Only used when an explicit Pythonic method/attribute is not defined.
+    The snake_case -> underlying name table is built once per class on first use.
     """
 
+    __slots__ = ()
+
     def __getattr__(self, name: str) -> Any:
         raw = super().__getattribute__("_raw")  # type: ignore[attr-defined]
-        camel = _snake_to_camel(name)
-        try:
-            return getattr(raw, camel)
-        except AttributeError:
-            raise
+        cls = type(self)
+        attr_map = cls.__dict__.get("_attr_map")
+        if attr_map is None and raw is not None:
+            attr_map = {_camel_to_snake(a): a for a in dir(raw) if a and not a.startswith("_")}
+            cls._attr_map = attr_map
+        target = attr_map.get(name) if attr_map is not None else None
+        if target is None:
+            # Not in the table: try the CamelCase spelling once and remember it
+            target = _snake_to_camel(name)
+            if not hasattr(raw, target):
+                raise AttributeError(f"{cls.__name__!r} object has no attribute {name!r}")
+            if attr_map is not None:
+                attr_map[name] = target
+        return getattr(raw, target)
 
     def __dir__(self) -> List[str]:
         # Expose snake_case versions of underlying CamelCase for IDEs
@@ -211,6 +516,19 @@ class _SnakePassthrough:
         return sorted(names)
 
 
+_set_rust_level = rusocks.set_logger_global_level
+_rust_default_level = rusocks.Level.Info
+
+# Python logging level -> Rust level, anything else maps to Info
+_py_to_rust_level: Dict[int, Any] = {
+    logging.DEBUG: rusocks.Level.Debug,
+    logging.INFO: rusocks.Level.Info,
+    logging.WARNING: rusocks.Level.Warn,
+    logging.ERROR: rusocks.Level.Error,
+    logging.CRITICAL: rusocks.Level.Error,
+}
+
+
 def set_log_level(level: Union[int, str]) -> None:
     """Set the global log level for rusocks."""
     if isinstance(level, str):
@@ -218,17 +536,4 @@ def set_log_level(level: Union[int, str]) -> None:
     _logger.setLevel(level)
     
     # Also set the Rust logger level
-    level_name = logging.getLevelName(level)
-    if level_name == "DEBUG":
-        rusocks.set_logger_global_level(rusocks.Level.Debug)
-    elif level_name == "INFO":
-        rusocks.set_logger_global_level(rusocks.Level.Info)
-    elif level_name == "WARNING":
-        rusocks.set_logger_global_level(rusocks.Level.Warn)
-    elif level_name == "ERROR":
-        rusocks.set_logger_global_level(rusocks.Level.Error)
-    elif level_name == "CRITICAL":
-        rusocks.set_logger_global_level(rusocks.Level.Error)
-    else:
-        # Default to INFO
-        rusocks.set_logger_global_level(rusocks.Level.Info)
\ No newline at end of file
+    _set_rust_level(_py_to_rust_level.get(level, _rust_default_level))
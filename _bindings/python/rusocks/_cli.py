@@ -5,20 +5,20 @@ This module provides a CLI for the rusocks package, allowing users to start
 servers and clients from the command line.
 """
 
-import asyncio
 import click
 import logging
 import os
 import signal
 import sys
-from typing import Optional, List, Dict, Any
+import threading
+from typing import Optional, Dict, Any
 
 from rich.console import Console
 from rich.logging import RichHandler
 from loguru import logger as loguru_logger
 
 from . import Server, Client, set_log_level
-from ._base import _to_duration
+from ._base import _Nanoseconds, _to_duration
 
 # Set up logging
 console = Console()
@@ -30,9 +30,60 @@ logging.basicConfig(
 )
 log = logging.getLogger("rusocks")
 
-# Global state
-_running_servers: List[Server] = []
-_running_clients: List[Client] = []
+_sigint_installed = False
+# Set by the SIGINT handler; the server/client commands block on it and close
+# their instance in a finally block
+_shutdown = threading.Event()
+
+
+class _DurationType(click.ParamType):
+    """Click parameter type that parses duration strings (e.g. '30s') once, at startup."""
+
+    name = "duration"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, _Nanoseconds):
+            return value
+        try:
+            return _Nanoseconds(_to_duration(value))
+        except ValueError as exc:
+            self.fail(str(exc), param, ctx)
+
+
+_DURATION = _DurationType()
+
+# Optional CLI parameters passed to the constructor only when set: (parameter, kwarg)
+_SERVER_OPTIONS = (
+    ("api", "api_key"),
+    ("buffer_size", "buffer_size"),
+    ("channel_timeout", "channel_timeout"),
+    ("connect_timeout", "connect_timeout"),
+    ("fast_open", "fast_open"),
+    ("upstream_proxy", "upstream_proxy"),
+    ("upstream_username", "upstream_username"),
+    ("upstream_password", "upstream_password"),
+)
+
+_CLIENT_OPTIONS = (
+    ("socks_username", "socks_username"),
+    ("socks_password", "socks_password"),
+    ("reconnect", "reconnect"),
+    ("reconnect_delay", "reconnect_delay"),
+    ("buffer_size", "buffer_size"),
+    ("channel_timeout", "channel_timeout"),
+    ("connect_timeout", "connect_timeout"),
+    ("threads", "threads"),
+    ("fast_open", "fast_open"),
+    ("upstream_proxy", "upstream_proxy"),
+    ("upstream_username", "upstream_username"),
+    ("upstream_password", "upstream_password"),
+    ("no_env_proxy", "no_env_proxy"),
+)
+
+
+def _collect_options(table, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build constructor kwargs from the truthy CLI parameters listed in table."""
+    return {kwarg: value for name, kwarg in table if (value := params.get(name))}
 
 
 def _setup_logging(verbose: bool) -> None:
@@ -43,32 +94,78 @@ def _setup_logging(verbose: bool) -> None:
 
 
 def _handle_sigint(signum, frame):
-    """Handle SIGINT (Ctrl+C) gracefully."""
+    """Handle SIGINT (Ctrl+C) gracefully; the running command does the cleanup."""
     console.print("\n[yellow]Received interrupt signal. Shutting down...[/yellow]")
-    for server in _running_servers:
-        try:
-            server.close()
-        except Exception as e:
-            console.print(f"[red]Error closing server: {e}[/red]")
-    
-    for client in _running_clients:
-        try:
-            client.close()
-        except Exception as e:
-            console.print(f"[red]Error closing client: {e}[/red]")
-    
-    sys.exit(0)
+    _shutdown.set()
+
 
+def _wait_for_shutdown() -> None:
+    """Block until SIGINT sets the shutdown event."""
+    if sys.platform == "win32":
+        # Blocking waits are not interruptible by Ctrl+C on Windows, so wake up periodically
+        while not _shutdown.wait(1.0):
+            pass
+    else:
+        _shutdown.wait()
 
-# Register signal handler
-signal.signal(signal.SIGINT, _handle_sigint)
+
+def _install_sigint_handler() -> None:
+    """Register the SIGINT handler once per process."""
+    global _sigint_installed
+    if _sigint_installed:
+        return
+    signal.signal(signal.SIGINT, _handle_sigint)
+    _sigint_installed = True
+
+
+def _run_client(
+    token: str,
+    url: str,
+    *,
+    reverse: bool,
+    verbose: bool,
+    socks_host: str = "127.0.0.1",
+    socks_port: int = 1080,
+    **options: Any,
+) -> None:
+    """Start a client and block until interrupted (shared by 'client' and 'provider')."""
+    _setup_logging(verbose)
+    
+    # Create client options
+    client_opts: Dict[str, Any] = {
+        "ws_url": url,
+        "reverse": reverse,
+        "logger": log,
+    }
+    
+    if not reverse:
+        client_opts["socks_host"] = socks_host
+        client_opts["socks_port"] = socks_port
+    
+    client_opts.update(_collect_options(_CLIENT_OPTIONS, options))
+    
+    # Create and start client
+    client = Client(token, **client_opts)
+    
+    console.print(f"[green]Client connected to {url}[/green]")
+    if not reverse:
+        console.print(f"[green]SOCKS5 server listening on {socks_host}:{socks_port}[/green]")
+    console.print("[yellow]Press Ctrl+C to stop[/yellow]")
+    
+    try:
+        # Keep the client running
+        client.wait_ready()
+        # Block until interrupted
+        _wait_for_shutdown()
+    finally:
+        client.close()
 
 
 @click.group()
 @click.version_option()
 def cli():
     """Rusocks: SOCKS5 over WebSocket proxy tool."""
-    pass
+    _install_sigint_handler()
 
 
 @cli.command()
@@ -79,14 +176,16 @@ def cli():
 @click.option("--socks-host", default="127.0.0.1", help="SOCKS5 server host (for reverse mode)")
 @click.option("--api", help="API key for HTTP management interface")
 @click.option("--buffer-size", type=int, help="Buffer size for data transfer")
-@click.option("--channel-timeout", help="Timeout for WebSocket channels (e.g., '30s')")
-@click.option("--connect-timeout", help="Timeout for outbound connections (e.g., '5s')")
+@click.option("--channel-timeout", type=_DURATION, help="Timeout for WebSocket channels (e.g., '30s')")
+@click.option("--connect-timeout", type=_DURATION, help="Timeout for outbound connections (e.g., '5s')")
 @click.option("--fast-open", is_flag=True, help="Assume connection success and allow data transfer immediately")
 @click.option("--upstream-proxy", help="Upstream proxy address for chaining")
 @click.option("--upstream-username", help="Username for upstream proxy authentication")
 @click.option("--upstream-password", help="Password for upstream proxy authentication")
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
+@click.pass_context
 def server(
+    ctx: click.Context,
     token: Optional[str],
     reverse: bool,
     port: int,
@@ -94,8 +193,8 @@ def server(
     socks_host: str,
     api: Optional[str],
     buffer_size: Optional[int],
-    channel_timeout: Optional[str],
-    connect_timeout: Optional[str],
+    channel_timeout: Optional[int],
+    connect_timeout: Optional[int],
     fast_open: bool,
     upstream_proxy: Optional[str],
     upstream_username: Optional[str],
@@ -115,33 +214,10 @@ def server(
     if reverse:
         server_opts["socks_host"] = socks_host
     
-    if api:
-        server_opts["api_key"] = api
-    
-    if buffer_size:
-        server_opts["buffer_size"] = buffer_size
-    
-    if channel_timeout:
-        server_opts["channel_timeout"] = channel_timeout
-    
-    if connect_timeout:
-        server_opts["connect_timeout"] = connect_timeout
-    
-    if fast_open:
-        server_opts["fast_open"] = True
-    
-    if upstream_proxy:
-        server_opts["upstream_proxy"] = upstream_proxy
-        
-    if upstream_username:
-        server_opts["upstream_username"] = upstream_username
-        
-    if upstream_password:
-        server_opts["upstream_password"] = upstream_password
+    server_opts.update(_collect_options(_SERVER_OPTIONS, ctx.params))
     
     # Create and start server
     server = Server(**server_opts)
-    _running_servers.append(server)
     
     if token:
         if reverse:
@@ -158,11 +234,7 @@ def server(
         # Keep the server running
         server.wait_ready()
         # Block until interrupted
-        while True:
-            try:
-                asyncio.get_event_loop().run_until_complete(asyncio.sleep(1))
-            except KeyboardInterrupt:
-                break
+        _wait_for_shutdown()
     finally:
         server.close()
 
@@ -176,10 +248,10 @@ def server(
 @click.option("--socks-username", help="SOCKS5 authentication username")
 @click.option("--socks-password", help="SOCKS5 authentication password")
 @click.option("--reconnect", is_flag=True, help="Automatically reconnect on disconnection")
-@click.option("--reconnect-delay", help="Delay between reconnection attempts (e.g., '5s')")
+@click.option("--reconnect-delay", type=_DURATION, help="Delay between reconnection attempts (e.g., '5s')")
 @click.option("--buffer-size", type=int, help="Buffer size for data transfer")
-@click.option("--channel-timeout", help="Timeout for WebSocket channels (e.g., '30s')")
-@click.option("--connect-timeout", help="Timeout for outbound connections (e.g., '5s')")
+@click.option("--channel-timeout", type=_DURATION, help="Timeout for WebSocket channels (e.g., '30s')")
+@click.option("--connect-timeout", type=_DURATION, help="Timeout for outbound connections (e.g., '5s')")
 @click.option("--threads", type=int, help="Number of threads for concurrent processing")
 @click.option("--fast-open", is_flag=True, help="Assume connection success and allow data transfer immediately")
 @click.option("--upstream-proxy", help="Upstream proxy address for chaining")
@@ -187,7 +259,9 @@ def server(
 @click.option("--upstream-password", help="Password for upstream proxy authentication")
 @click.option("--no-env-proxy", is_flag=True, help="Ignore proxy environment variables")
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
+@click.pass_context
 def client(
+    ctx: click.Context,
     token: str,
     url: str,
     reverse: bool,
@@ -196,10 +270,10 @@ def client(
     socks_username: Optional[str],
     socks_password: Optional[str],
     reconnect: bool,
-    reconnect_delay: Optional[str],
+    reconnect_delay: Optional[int],
     buffer_size: Optional[int],
-    channel_timeout: Optional[str],
-    connect_timeout: Optional[str],
+    channel_timeout: Optional[int],
+    connect_timeout: Optional[int],
     threads: Optional[int],
     fast_open: bool,
     upstream_proxy: Optional[str],
@@ -209,88 +283,17 @@ def client(
     verbose: bool,
 ):
     """Start a SOCKS5 over WebSocket client."""
-    _setup_logging(verbose)
-    
-    # Create client options
-    client_opts: Dict[str, Any] = {
-        "ws_url": url,
-        "reverse": reverse,
-        "logger": log,
-    }
-    
-    if not reverse:
-        client_opts["socks_host"] = socks_host
-        client_opts["socks_port"] = socks_port
-    
-    if socks_username:
-        client_opts["socks_username"] = socks_username
-        
-    if socks_password:
-        client_opts["socks_password"] = socks_password
-    
-    if reconnect:
-        client_opts["reconnect"] = True
-        
-    if reconnect_delay:
-        client_opts["reconnect_delay"] = reconnect_delay
-    
-    if buffer_size:
-        client_opts["buffer_size"] = buffer_size
-    
-    if channel_timeout:
-        client_opts["channel_timeout"] = channel_timeout
-    
-    if connect_timeout:
-        client_opts["connect_timeout"] = connect_timeout
-    
-    if threads:
-        client_opts["threads"] = threads
-    
-    if fast_open:
-        client_opts["fast_open"] = True
-    
-    if upstream_proxy:
-        client_opts["upstream_proxy"] = upstream_proxy
-        
-    if upstream_username:
-        client_opts["upstream_username"] = upstream_username
-        
-    if upstream_password:
-        client_opts["upstream_password"] = upstream_password
-    
-    if no_env_proxy:
-        client_opts["no_env_proxy"] = True
-    
-    # Create and start client
-    client = Client(token, **client_opts)
-    _running_clients.append(client)
-    
-    console.print(f"[green]Client connected to {url}[/green]")
-    if not reverse:
-        console.print(f"[green]SOCKS5 server listening on {socks_host}:{socks_port}[/green]")
-    console.print("[yellow]Press Ctrl+C to stop[/yellow]")
-    
-    try:
-        # Keep the client running
-        client.wait_ready()
-        # Block until interrupted
-        while True:
-            try:
-                asyncio.get_event_loop().run_until_complete(asyncio.sleep(1))
-            except KeyboardInterrupt:
-                break
-    finally:
-        client.close()
+    _run_client(**ctx.params)
 
 
 @cli.command()
 @click.option("-t", "--token", required=True, help="Authentication token")
 @click.option("-u", "--url", required=True, help="WebSocket server URL")
 @click.option("--reconnect", is_flag=True, help="Automatically reconnect on disconnection")
-@click.option("--reconnect-delay", help="Delay between reconnection attempts (e.g., '5s')")
+@click.option("--reconnect-delay", type=_DURATION, help="Delay between reconnection attempts (e.g., '5s')")
 @click.option("--buffer-size", type=int, help="Buffer size for data transfer")
-@click.option("--channel-timeout", help="Timeout for WebSocket channels (e.g., '30s')")
-@click.option("--connect-timeout", help="Timeout for outbound connections (e.g., '5s')")
+@click.option("--channel-timeout", type=_DURATION, help="Timeout for WebSocket channels (e.g., '30s')")
+@click.option("--connect-timeout", type=_DURATION, help="Timeout for outbound connections (e.g., '5s')")
 @click.option("--threads", type=int, help="Number of threads for concurrent processing")
 @click.option("--fast-open", is_flag=True, help="Assume connection success and allow data transfer immediately")
 @click.option("--upstream-proxy", help="Upstream proxy address for chaining")
@@ -298,14 +301,16 @@ def client(
 @click.option("--upstream-password", help="Password for upstream proxy authentication")
 @click.option("--no-env-proxy", is_flag=True, help="Ignore proxy environment variables")
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
+@click.pass_context
 def provider(
+    ctx: click.Context,
     token: str,
     url: str,
     reconnect: bool,
-    reconnect_delay: Optional[str],
+    reconnect_delay: Optional[int],
     buffer_size: Optional[int],
-    channel_timeout: Optional[str],
-    connect_timeout: Optional[str],
+    channel_timeout: Optional[int],
+    connect_timeout: Optional[int],
     threads: Optional[int],
     fast_open: bool,
     upstream_proxy: Optional[str],
@@ -315,29 +320,8 @@ def provider(
     verbose: bool,
 ):
     """Start a reverse proxy client (alias for 'client -r')."""
-    # Call client command with reverse flag
-    ctx = click.Context(client)
-    client.callback(
-        token=token,
-        url=url,
-        reverse=True,  # Force reverse mode
-        socks_host="127.0.0.1",  # Default value, not used in reverse mode
-        socks_port=1080,  # Default value, not used in reverse mode
-        socks_username=None,
-        socks_password=None,
-        reconnect=reconnect,
-        reconnect_delay=reconnect_delay,
-        buffer_size=buffer_size,
-        channel_timeout=channel_timeout,
-        connect_timeout=connect_timeout,
-        threads=threads,
-        fast_open=fast_open,
-        upstream_proxy=upstream_proxy,
-        upstream_username=upstream_username,
-        upstream_password=upstream_password,
-        no_env_proxy=no_env_proxy,
-        verbose=verbose,
-    )
+    # provider has no --reverse option, so ctx.params cannot repeat the keyword
+    _run_client(**ctx.params, reverse=True)
 
 
 if __name__ == "__main__":
@@ -9,20 +9,63 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Optional
 
 # Underlying Rust bindings module (generated)
 from rusockslib import rusocks  # type: ignore
 
+from . import _base
 from ._base import (
+    _compile_option_setter,
+    _ensure_runtime,
+    _managed_logger_for,
+    _release_handles,
+    _BLOCKING_EXEC,
+    _run_blocking_wait,
+    _run_in_executor,
     _SnakePassthrough,
     _to_duration,
     _logger,
-    BufferZerologLogger,
     DurationLike,
+    OptionFields,
 )
 
 
+# Constructor kwargs forwarded to rusocks.ClientOptions
+_CLIENT_FIELDS: OptionFields = (
+    ("ws_url", None),
+    ("reverse", bool),
+    ("socks_host", None),
+    ("socks_port", int),
+    ("socks_username", None),
+    ("socks_password", None),
+    ("socks_wait_server", bool),
+    ("reconnect", bool),
+    ("reconnect_delay", _to_duration),
+    ("buffer_size", int),
+    ("channel_timeout", _to_duration),
+    ("connect_timeout", _to_duration),
+    ("threads", int),
+    ("fast_open", bool),
+    ("upstream_proxy", None),
+    ("upstream_username", None),
+    ("upstream_password", None),
+    ("no_env_proxy", bool),
+    ("user_agent", None),
+    ("so_sndbuf", int),
+    ("so_rcvbuf", int),
+    ("tcp_nodelay", bool),
+)
+_apply_client_options = _compile_option_setter(_CLIENT_FIELDS, "_apply_client_options")
+
+
+def _not_connected() -> bool:
+    # is_connected fallback for bindings that do not expose the field
+    return False
+
+
 class Client(_SnakePassthrough):
     """WebSocket SOCKS5 proxy client.
     
@@ -36,6 +79,17 @@ class Client(_SnakePassthrough):
     back through WebSocket to a SOCKS5 server running on the server side.
     """
 
+    __slots__ = (
+        "_raw",
+        "_managed_logger",
+        "_ctx",
+        "_finalizer",
+        "_executor",
+        "_cached_socks_port",
+        "_is_connected_getter",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         token: str,
@@ -60,6 +114,9 @@ class Client(_SnakePassthrough):
         upstream_password: Optional[str] = None,
         no_env_proxy: Optional[bool] = None,
         user_agent: Optional[str] = None,
+        so_sndbuf: Optional[int] = None,
+        so_rcvbuf: Optional[int] = None,
+        tcp_nodelay: Optional[bool] = True,
     ) -> None:
         """Initialize the WebSocket SOCKS5 proxy client.
         
@@ -75,7 +132,8 @@ class Client(_SnakePassthrough):
             socks_wait_server: Whether to wait for server connection before starting SOCKS5
             reconnect: Whether to automatically reconnect on disconnection
             reconnect_delay: Delay between reconnection attempts
-            buffer_size: Buffer size for data transfer
+            buffer_size: Buffer size for data transfer (defaults to 32 KiB,
+                see set_default_buffer_size)
             channel_timeout: Timeout for WebSocket channels
             connect_timeout: Timeout for outbound connections
             threads: Number of threads for concurrent processing
@@ -85,59 +143,62 @@ class Client(_SnakePassthrough):
             upstream_password: Password for upstream proxy authentication
             no_env_proxy: Whether to ignore proxy environment variables
             user_agent: Custom User-Agent header for WebSocket connections
+            so_sndbuf: Send buffer size in bytes for connections accepted by the local
+                SOCKS5 listener (defaults to 1 MiB, 0 keeps the OS default)
+            so_rcvbuf: Receive buffer size in bytes for connections accepted by the local
+                SOCKS5 listener (defaults to 1 MiB, 0 keeps the OS default)
+            tcp_nodelay: Disable Nagle's algorithm on proxied connections (default True);
+                turning it off only helps bulk byte-rate-bound traffic on a LAN
         """
+        # Set up front so close() works even if construction fails
+        self._raw = None
+        self._managed_logger = None
+        self._ctx = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._executor: Executor = _BLOCKING_EXEC
+        self._cached_socks_port: Optional[int] = None
+        self._is_connected_getter: Callable[[], bool] = _not_connected
+
+        if buffer_size is None:
+            buffer_size = _base._DEFAULT_BUFFER_SIZE
+        if so_sndbuf is None:
+            so_sndbuf = _base._DEFAULT_SOCKET_BUFFER
+        if so_rcvbuf is None:
+            so_rcvbuf = _base._DEFAULT_SOCKET_BUFFER
+        values = locals()
+
         # Initialize the Rust runtime
-        rusocks.init_global_runtime()
+        _ensure_runtime()
         
         # Create client options
         opt = rusocks.ClientOptions()
         if logger is None:
             logger = _logger
-        # Use buffer-based logger system
-        self._managed_logger = BufferZerologLogger(logger, f"client_{id(self)}")
+        _apply_client_options(opt, values)
+
+        # Blocking calls from the async wrappers get a pool sized to match the
+        # requested runtime threads; otherwise the shared pool is used
+        self._executor = (
+            ThreadPoolExecutor(max_workers=int(threads), thread_name_prefix="rusocks-client")
+            if threads
+            else _BLOCKING_EXEC
+        )
+
+        # Use buffer-based logger system, or a null sink if the logger is disabled
+        self._managed_logger = _managed_logger_for(logger, f"client_{id(self)}")
         opt.logger = self._managed_logger.rust_logger
-        if ws_url is not None:
-            opt.ws_url = ws_url
-        if reverse is not None:
-            opt.reverse = bool(reverse)
-        if socks_host is not None:
-            opt.socks_host = socks_host
-        if socks_port is not None:
-            opt.socks_port = int(socks_port)
-        if socks_username is not None:
-            opt.socks_username = socks_username
-        if socks_password is not None:
-            opt.socks_password = socks_password
-        if socks_wait_server is not None:
-            opt.socks_wait_server = bool(socks_wait_server)
-        if reconnect is not None:
-            opt.reconnect = bool(reconnect)
-        if reconnect_delay is not None:
-            opt.reconnect_delay = _to_duration(reconnect_delay)
-        if buffer_size is not None:
-            opt.buffer_size = int(buffer_size)
-        if channel_timeout is not None:
-            opt.channel_timeout = _to_duration(channel_timeout)
-        if connect_timeout is not None:
-            opt.connect_timeout = _to_duration(connect_timeout)
-        if threads is not None:
-            opt.threads = int(threads)
-        if fast_open is not None:
-            opt.fast_open = bool(fast_open)
-        if upstream_proxy is not None:
-            opt.upstream_proxy = upstream_proxy
-        if upstream_username is not None:
-            opt.upstream_username = upstream_username
-        if upstream_password is not None:
-            opt.upstream_password = upstream_password
-        if no_env_proxy is not None:
-            opt.no_env_proxy = bool(no_env_proxy)
-        if user_agent is not None:
-            opt.user_agent = user_agent
 
         # Create the client
-        self._raw = rusocks.Client(token, opt)
-        self._ctx = None
+        try:
+            self._raw = rusocks.Client(token, opt)
+        except Exception:
+            self._managed_logger.cleanup()
+            raise
+        # Resolve once whether the bindings expose the connection state
+        if hasattr(self._raw, "is_connected"):
+            self._is_connected_getter = lambda r=self._raw: bool(r.is_connected)
+        # Release the Rust side if the client is collected without close()
+        self._finalizer = weakref.finalize(self, _release_handles, self._raw, self._managed_logger, self._executor)
 
     @property
     def log(self) -> logging.Logger:
@@ -165,7 +226,12 @@ class Client(_SnakePassthrough):
             self._ctx = rusocks.ContextWithCancel()
         timeout_duration = _to_duration(timeout) if timeout is not None else 0
         try:
-            return await asyncio.to_thread(self._raw.wait_ready, self._ctx, timeout_duration)
+            # Bindings that can wait natively hand back an awaitable; otherwise
+            # block a dedicated thread on the synchronous call
+            wait_future = getattr(self._raw, "wait_ready_future", None)
+            if wait_future is not None:
+                return await wait_future(self._ctx, timeout_duration)
+            return await _run_blocking_wait(self._raw.wait_ready, self._ctx, timeout_duration)
         except asyncio.CancelledError:
             # Ensure the underlying Rust client stops retrying/logging when the
             # awaiting task is cancelled (e.g. Ctrl+C). We cancel the context
@@ -176,9 +242,9 @@ class Client(_SnakePassthrough):
                 except Exception:
                     pass
                 # Shield cleanup from further cancellation so it can complete
-                await asyncio.shield(asyncio.to_thread(self._raw.close))
+                await asyncio.shield(_run_in_executor(self._executor, self._raw.close))
                 # Best-effort logger cleanup
-                if hasattr(self, '_managed_logger') and self._managed_logger:
+                if self._managed_logger:
                     try:
                         self._managed_logger.cleanup()
                     except Exception:
@@ -206,7 +272,7 @@ class Client(_SnakePassthrough):
         Returns:
             The connector token string (generated or provided)
         """
-        return await asyncio.to_thread(self._raw.add_connector, connector_token or "")
+        return await _run_in_executor(self._executor, self._raw.add_connector, connector_token or "")
 
     @property
     def is_connected(self) -> bool:
@@ -215,11 +281,7 @@ class Client(_SnakePassthrough):
         Returns:
             True if connected, False otherwise
         """
-        try:
-            return bool(self._raw.is_connected)
-        except Exception:
-            # If not exposed as field, fall back to False
-            return False
+        return self._is_connected_getter()
 
     @property
     def socks_port(self) -> Optional[int]:
@@ -228,52 +290,71 @@ class Client(_SnakePassthrough):
         Returns:
             The port number if available, None otherwise
         """
+        # The port does not change once assigned, so keep the first real value
+        if self._cached_socks_port is not None:
+            return self._cached_socks_port
         try:
             # Exposed field in bindings
             port = getattr(self._raw, "socks_port", None)
-            return int(port) if port is not None else None
+            if port is not None:
+                self._cached_socks_port = int(port)
+            return self._cached_socks_port
         except Exception:
             return None
 
     def close(self) -> None:
         """Close the client and clean up resources."""
         # Close client
-        if hasattr(self, '_raw') and self._raw:
+        if self._raw:
             self._raw.close()
         # Clean up managed logger
-        if hasattr(self, '_managed_logger') and self._managed_logger:
+        if self._managed_logger:
             try:
                 self._managed_logger.cleanup()
             except:
                 # Ignore cleanup errors
                 pass
         # Close context
-        if hasattr(self, '_ctx') and self._ctx:
+        if self._ctx:
             try:
                 self._ctx.cancel()
             except Exception:
                 # Ignore errors during context close
                 pass
+        # Release a per-client pool
+        if self._executor is not _BLOCKING_EXEC:
+            self._executor.shutdown(wait=False)
+        # Everything is released; the finalizer has nothing left to do
+        if self._finalizer is not None:
+            self._finalizer.detach()
 
     async def async_close(self) -> None:
         """Close the client and clean up resources asynchronously."""
-        # Close client
-        if hasattr(self, '_raw') and self._raw:
-            await asyncio.to_thread(self._raw.close)
-        # Clean up managed logger
-        if hasattr(self, '_managed_logger') and self._managed_logger:
-            try:
-                self._managed_logger.cleanup()
-            except:
-                # Ignore cleanup errors
-                pass
-        # Close context
-        if hasattr(self, '_ctx') and self._ctx:
+        # Cancel the context first so Rust stops waiting instead of draining
+        if self._ctx:
             try:
                 self._ctx.cancel()
             except Exception:
                 # Ignore errors during context close
                 pass
+        try:
+            # Shielded so a cancelled caller cannot abandon the close half-way
+            if self._raw:
+                await asyncio.shield(_run_in_executor(self._executor, self._raw.close))
+        finally:
+            # Clean up managed logger
+            if self._managed_logger:
+                try:
+                    self._managed_logger.cleanup()
+                except Exception:
+                    # Ignore cleanup errors
+                    pass
+            # Release a per-client pool
+            if self._executor is not _BLOCKING_EXEC:
+                self._executor.shutdown(wait=False)
+        # Everything is released; the finalizer has nothing left to do
+        if self._finalizer is not None:
+            self._finalizer.detach()
 
     # Context manager support
     def __enter__(self) -> "Client":
@@ -291,12 +372,4 @@ class Client(_SnakePassthrough):
         
     async def __aexit__(self, exc_type, exc, tb) -> None:
         """Async context manager exit."""
-        await self.async_close()
-        
-    def __del__(self):
-        """Destructor - clean up resources."""
-        try:
-            self.close()
-        except Exception:
-            # Ignore errors during cleanup
-            pass
\ No newline at end of file
+        await self.async_close()
\ No newline at end of file
@@ -9,21 +9,93 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Optional
+import threading
+import weakref
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
 
 # Underlying Rust bindings module (generated)
 from rusockslib import rusocks  # type: ignore
 
+from . import _base
 from ._base import (
+    _compile_option_setter,
+    _ensure_runtime,
+    _managed_logger_for,
+    _release_handles,
+    _run_blocking_wait,
+    _run_in_thread,
     _SnakePassthrough,
     _to_duration,
     _logger,
-    BufferZerologLogger,
     ReverseTokenResult,
     DurationLike,
+    OptionFields,
 )
 
 
+# Constructor kwargs forwarded to rusocks.ServerOptions
+_SERVER_FIELDS: OptionFields = (
+    ("ws_host", None),
+    ("ws_port", None),
+    ("socks_host", None),
+    ("port_pool", None),
+    ("socks_wait_client", bool),
+    ("buffer_size", int),
+    ("api_key", None),
+    ("channel_timeout", _to_duration),
+    ("connect_timeout", _to_duration),
+    ("fast_open", bool),
+    ("upstream_proxy", None),
+    ("upstream_username", None),
+    ("upstream_password", None),
+    ("so_sndbuf", int),
+    ("so_rcvbuf", int),
+    ("tcp_nodelay", bool),
+)
+_apply_server_options = _compile_option_setter(_SERVER_FIELDS, "_apply_server_options")
+
+
+# Per-thread ReverseTokenOptions reused across add_reverse_token calls
+_reverse_opts_local = threading.local()
+_REVERSE_TOKEN_FIELDS = ("token", "port", "username", "password", "allow_manage_connector")
+
+
+def _reverse_token_options() -> Any:
+    """Return this thread's ReverseTokenOptions with every field reset to its default."""
+    cached = getattr(_reverse_opts_local, "value", None)
+    if cached is None:
+        opts = rusocks.ReverseTokenOptions()
+        defaults = tuple((name, getattr(opts, name)) for name in _REVERSE_TOKEN_FIELDS)
+        _reverse_opts_local.value = (opts, defaults)
+        return opts
+    opts, defaults = cached
+    for name, value in defaults:
+        setattr(opts, name, value)
+    return opts
+
+
+def _fill_reverse_token_options(
+    opts: Any,
+    token: Optional[str] = None,
+    port: Optional[int] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    allow_manage_connector: Optional[bool] = None,
+) -> Any:
+    """Copy the provided add_reverse_token arguments onto opts and return it."""
+    if token:
+        opts.token = token
+    if port is not None:
+        opts.port = int(port)
+    if username is not None:
+        opts.username = username
+    if password is not None:
+        opts.password = password
+    if allow_manage_connector is not None:
+        opts.allow_manage_connector = bool(allow_manage_connector)
+    return opts
+
+
 class Server(_SnakePassthrough):
     """WebSocket SOCKS5 proxy server.
     
@@ -37,6 +109,8 @@ class Server(_SnakePassthrough):
     through WebSocket to clients, which then connect to targets directly.
     """
 
+    __slots__ = ("_raw", "_managed_logger", "_ctx", "_finalizer", "__weakref__")
+
     def __init__(
         self,
         *,
@@ -54,6 +128,9 @@ class Server(_SnakePassthrough):
         upstream_proxy: Optional[str] = None,
         upstream_username: Optional[str] = None,
         upstream_password: Optional[str] = None,
+        so_sndbuf: Optional[int] = None,
+        so_rcvbuf: Optional[int] = None,
+        tcp_nodelay: Optional[bool] = True,
     ) -> None:
         """Initialize the WebSocket SOCKS5 proxy server.
         
@@ -64,7 +141,8 @@ class Server(_SnakePassthrough):
             socks_host: SOCKS5 server listen address (for reverse mode)
             port_pool: Pool of ports for SOCKS5 servers
             socks_wait_client: Whether to wait for client connections before starting SOCKS5
-            buffer_size: Buffer size for data transfer
+            buffer_size: Buffer size for data transfer (defaults to 32 KiB,
+                see set_default_buffer_size)
             api_key: API key for HTTP management interface
             channel_timeout: Timeout for WebSocket channels
             connect_timeout: Timeout for outbound connections
@@ -72,47 +150,49 @@ class Server(_SnakePassthrough):
             upstream_proxy: Upstream proxy address for chaining
             upstream_username: Username for upstream proxy authentication
             upstream_password: Password for upstream proxy authentication
+            so_sndbuf: Send buffer size in bytes for accepted WebSocket and SOCKS5
+                connections and forward-mode target dials (defaults to 1 MiB,
+                0 keeps the OS default)
+            so_rcvbuf: Receive buffer size in bytes for the same sockets (defaults
+                to 1 MiB, 0 keeps the OS default)
+            tcp_nodelay: Disable Nagle's algorithm on proxied connections (default True);
+                turning it off only helps bulk byte-rate-bound traffic on a LAN
         """
+        # Set up front so close() works even if construction fails
+        self._raw = None
+        self._managed_logger = None
+        self._ctx = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+        if buffer_size is None:
+            buffer_size = _base._DEFAULT_BUFFER_SIZE
+        if so_sndbuf is None:
+            so_sndbuf = _base._DEFAULT_SOCKET_BUFFER
+        if so_rcvbuf is None:
+            so_rcvbuf = _base._DEFAULT_SOCKET_BUFFER
+        values = locals()
+
         # Initialize the Rust runtime
-        rusocks.init_global_runtime()
+        _ensure_runtime()
         
         # Create server options
         opt = rusocks.ServerOptions()
         if logger is None:
             logger = _logger
-        # Use buffer-based logger system
-        self._managed_logger = BufferZerologLogger(logger, f"server_{id(self)}")
+        _apply_server_options(opt, values)
+
+        # Use buffer-based logger system, or a null sink if the logger is disabled
+        self._managed_logger = _managed_logger_for(logger, f"server_{id(self)}")
         opt.logger = self._managed_logger.rust_logger
-        if ws_host is not None:
-            opt.ws_host = ws_host
-        if ws_port is not None:
-            opt.ws_port = ws_port
-        if socks_host is not None:
-            opt.socks_host = socks_host
-        if port_pool is not None:
-            opt.port_pool = port_pool
-        if socks_wait_client is not None:
-            opt.socks_wait_client = bool(socks_wait_client)
-        if buffer_size is not None:
-            opt.buffer_size = int(buffer_size)
-        if api_key is not None:
-            opt.api_key = api_key
-        if channel_timeout is not None:
-            opt.channel_timeout = _to_duration(channel_timeout)
-        if connect_timeout is not None:
-            opt.connect_timeout = _to_duration(connect_timeout)
-        if fast_open is not None:
-            opt.fast_open = bool(fast_open)
-        if upstream_proxy is not None:
-            opt.upstream_proxy = upstream_proxy
-        if upstream_username is not None:
-            opt.upstream_username = upstream_username
-        if upstream_password is not None:
-            opt.upstream_password = upstream_password
 
         # Create the server
-        self._raw = rusocks.Server(opt)
-        self._ctx = None
+        try:
+            self._raw = rusocks.Server(opt)
+        except Exception:
+            self._managed_logger.cleanup()
+            raise
+        # Release the Rust side if the server is collected without close()
+        self._finalizer = weakref.finalize(self, _release_handles, self._raw, self._managed_logger)
 
     @property
     def log(self) -> logging.Logger:
@@ -139,7 +219,7 @@ class Server(_SnakePassthrough):
         Returns:
             The token string (generated or provided)
         """
-        return await asyncio.to_thread(self._raw.add_forward_token, token or "")
+        return await _run_in_thread(self._raw.add_forward_token, token or "")
 
     def add_reverse_token(
         self,
@@ -162,17 +242,9 @@ class Server(_SnakePassthrough):
         Returns:
             Result containing the token and assigned port
         """
-        opts = rusocks.ReverseTokenOptions()
-        if token:
-            opts.token = token
-        if port is not None:
-            opts.port = int(port)
-        if username is not None:
-            opts.username = username
-        if password is not None:
-            opts.password = password
-        if allow_manage_connector is not None:
-            opts.allow_manage_connector = bool(allow_manage_connector)
+        opts = _fill_reverse_token_options(
+            _reverse_token_options(), token, port, username, password, allow_manage_connector
+        )
         result = self._raw.add_reverse_token(opts)
         return ReverseTokenResult(token=result.token, port=result.port)
 
@@ -197,19 +269,15 @@ class Server(_SnakePassthrough):
         Returns:
             Result containing the token and assigned port
         """
-        opts = rusocks.ReverseTokenOptions()
-        if token:
-            opts.token = token
-        if port is not None:
-            opts.port = int(port)
-        if username is not None:
-            opts.username = username
-        if password is not None:
-            opts.password = password
-        if allow_manage_connector is not None:
-            opts.allow_manage_connector = bool(allow_manage_connector)
-        result = await asyncio.to_thread(self._raw.add_reverse_token, opts)
-        return ReverseTokenResult(token=result.token, port=result.port)
+        # Options are filled on the worker thread from its own pooled instance
+        return await _run_in_thread(
+            self.add_reverse_token,
+            token=token,
+            port=port,
+            username=username,
+            password=password,
+            allow_manage_connector=allow_manage_connector,
+        )
 
     def add_connector_token(self, connector_token: Optional[str], reverse_token: str) -> str:
         """Add a connector token for reverse proxy.
@@ -233,7 +301,131 @@ class Server(_SnakePassthrough):
         Returns:
             The connector token string (generated or provided)
         """
-        return await asyncio.to_thread(self._raw.add_connector_token, connector_token or "", reverse_token)
+        return await _run_in_thread(self._raw.add_connector_token, connector_token or "", reverse_token)
+
+    def add_forward_tokens(self, tokens: Iterable[Optional[str]]) -> List[str]:
+        """Add several forward proxy tokens in a single call into Rust.
+        
+        Bindings without a batch call get one add_forward_token call per token.
+        
+        Args:
+            tokens: Token strings; empty or None entries are auto-generated
+            
+        Returns:
+            The token strings, in input order
+        """
+        tokens = [t or "" for t in tokens]
+        add_batch = getattr(self._raw, "add_forward_tokens", None)
+        if add_batch is not None:
+            return add_batch(tokens)
+        add_one = self._raw.add_forward_token
+        return [add_one(t) for t in tokens]
+
+    async def async_add_forward_tokens(self, tokens: Iterable[Optional[str]]) -> List[str]:
+        """Add several forward proxy tokens asynchronously.
+        
+        Args:
+            tokens: Token strings; empty or None entries are auto-generated
+            
+        Returns:
+            The token strings, in input order
+        """
+        # Materialize here so caller-supplied iterators are not consumed off-thread
+        return await _run_in_thread(self.add_forward_tokens, list(tokens))
+
+    def add_connector_tokens(self, pairs: Iterable[Tuple[Optional[str], str]]) -> List[str]:
+        """Add several connector tokens in a single call into Rust.
+        
+        Bindings without a batch call get one add_connector_token call per pair.
+        
+        Args:
+            pairs: (connector_token, reverse_token) pairs; an empty or None
+                connector token is auto-generated
+            
+        Returns:
+            The connector token strings, in input order
+        """
+        pairs = [(c or "", r) for c, r in pairs]
+        add_batch = getattr(self._raw, "add_connector_tokens", None)
+        if add_batch is not None:
+            return add_batch(pairs)
+        add_one = self._raw.add_connector_token
+        return [add_one(c, r) for c, r in pairs]
+
+    async def async_add_connector_tokens(self, pairs: Iterable[Tuple[Optional[str], str]]) -> List[str]:
+        """Add several connector tokens asynchronously.
+        
+        Args:
+            pairs: (connector_token, reverse_token) pairs; an empty or None
+                connector token is auto-generated
+            
+        Returns:
+            The connector token strings, in input order
+        """
+        # Materialize here so caller-supplied iterators are not consumed off-thread
+        return await _run_in_thread(self.add_connector_tokens, list(pairs))
+
+    def configure_and_serve(
+        self,
+        forward_tokens: Iterable[Optional[str]] = (),
+        reverse_tokens: Iterable[Mapping[str, Any]] = (),
+        connector_tokens: Iterable[Tuple[Optional[str], str]] = (),
+    ) -> Tuple[List[str], List[ReverseTokenResult], List[str]]:
+        """Register tokens and start serving in a single call into Rust.
+        
+        Reverse tokens are added before connector tokens, so connector pairs
+        may name reverse tokens from the same call. Bindings without the fused
+        call get the individual token adds followed by wait_ready().
+        
+        Args:
+            forward_tokens: Forward token strings; empty or None entries are auto-generated
+            reverse_tokens: Mappings of add_reverse_token keyword arguments
+            connector_tokens: (connector_token, reverse_token) pairs
+            
+        Returns:
+            The forward tokens, reverse token results and connector tokens, in input order
+        """
+        reverse_opts = [
+            _fill_reverse_token_options(rusocks.ReverseTokenOptions(), **spec) for spec in reverse_tokens
+        ]
+        fused = getattr(self._raw, "configure_and_serve", None)
+        if fused is None:
+            forward = self.add_forward_tokens(forward_tokens)
+            reverse = [self._raw.add_reverse_token(opts) for opts in reverse_opts]
+            connector = self.add_connector_tokens(connector_tokens)
+            self.wait_ready()
+        else:
+            forward, reverse, connector = fused(
+                [t or "" for t in forward_tokens],
+                reverse_opts,
+                [(c or "", r) for c, r in connector_tokens],
+            )
+        return (
+            list(forward),
+            [ReverseTokenResult(token=r.token, port=r.port) for r in reverse],
+            list(connector),
+        )
+
+    async def async_configure_and_serve(
+        self,
+        forward_tokens: Iterable[Optional[str]] = (),
+        reverse_tokens: Iterable[Mapping[str, Any]] = (),
+        connector_tokens: Iterable[Tuple[Optional[str], str]] = (),
+    ) -> Tuple[List[str], List[ReverseTokenResult], List[str]]:
+        """Register tokens and start serving asynchronously.
+        
+        Args:
+            forward_tokens: Forward token strings; empty or None entries are auto-generated
+            reverse_tokens: Mappings of add_reverse_token keyword arguments
+            connector_tokens: (connector_token, reverse_token) pairs
+            
+        Returns:
+            The forward tokens, reverse token results and connector tokens, in input order
+        """
+        # Materialize here so caller-supplied iterators are not consumed off-thread
+        return await _run_in_thread(
+            self.configure_and_serve, list(forward_tokens), list(reverse_tokens), list(connector_tokens)
+        )
 
     def remove_token(self, token: str) -> bool:
         """Remove a token from the server.
@@ -255,7 +447,7 @@ class Server(_SnakePassthrough):
         Returns:
             True if token was removed, False if not found
         """
-        return await asyncio.to_thread(self._raw.remove_token, token)
+        return await _run_in_thread(self._raw.remove_token, token)
 
     def wait_ready(self, timeout: Optional[DurationLike] = None) -> None:
         """Wait for the server to be ready.
@@ -278,7 +470,12 @@ class Server(_SnakePassthrough):
             self._ctx = rusocks.ContextWithCancel()
         timeout_duration = _to_duration(timeout) if timeout is not None else 0
         try:
-            return await asyncio.to_thread(self._raw.wait_ready, self._ctx, timeout_duration)
+            # Bindings that can wait natively hand back an awaitable; otherwise
+            # block a dedicated thread on the synchronous call
+            wait_future = getattr(self._raw, "wait_ready_future", None)
+            if wait_future is not None:
+                return await wait_future(self._ctx, timeout_duration)
+            return await _run_blocking_wait(self._raw.wait_ready, self._ctx, timeout_duration)
         except asyncio.CancelledError:
             # Ensure the underlying Rust server stops when startup wait is cancelled
             try:
@@ -286,8 +483,8 @@ class Server(_SnakePassthrough):
                     self._ctx.cancel()
                 except Exception:
                     pass
-                await asyncio.shield(asyncio.to_thread(self._raw.close))
-                if hasattr(self, '_managed_logger') and self._managed_logger:
+                await asyncio.shield(_run_in_thread(self._raw.close))
+                if self._managed_logger:
                     try:
                         self._managed_logger.cleanup()
                     except Exception:
@@ -298,42 +495,50 @@ class Server(_SnakePassthrough):
     def close(self) -> None:
         """Close the server and clean up resources."""
         # Close server
-        if hasattr(self, '_raw') and self._raw:
+        if self._raw:
             self._raw.close()
         # Clean up managed logger
-        if hasattr(self, '_managed_logger') and self._managed_logger:
+        if self._managed_logger:
             try:
                 self._managed_logger.cleanup()
             except:
                 # Ignore cleanup errors
                 pass
         # Close context
-        if hasattr(self, '_ctx') and self._ctx:
+        if self._ctx:
             try:
                 self._ctx.cancel()
             except Exception:
                 # Ignore errors during context close
                 pass
+        # Everything is released; the finalizer has nothing left to do
+        if self._finalizer is not None:
+            self._finalizer.detach()
 
     async def async_close(self) -> None:
         """Close the server and clean up resources asynchronously."""
-        # Close server
-        if hasattr(self, '_raw') and self._raw:
-            await asyncio.to_thread(self._raw.close)
-        # Clean up managed logger
-        if hasattr(self, '_managed_logger') and self._managed_logger:
-            try:
-                self._managed_logger.cleanup()
-            except:
-                # Ignore cleanup errors
-                pass
-        # Close context
-        if hasattr(self, '_ctx') and self._ctx:
+        # Cancel the context first so Rust stops waiting instead of draining
+        if self._ctx:
             try:
                 self._ctx.cancel()
             except Exception:
                 # Ignore errors during context close
                 pass
+        try:
+            # Shielded so a cancelled caller cannot abandon the close half-way
+            if self._raw:
+                await asyncio.shield(_run_in_thread(self._raw.close))
+        finally:
+            # Clean up managed logger
+            if self._managed_logger:
+                try:
+                    self._managed_logger.cleanup()
+                except Exception:
+                    # Ignore cleanup errors
+                    pass
+        # Everything is released; the finalizer has nothing left to do
+        if self._finalizer is not None:
+            self._finalizer.detach()
     
     def __enter__(self) -> "Server":
         """Context manager entry."""
@@ -351,12 +556,4 @@ class Server(_SnakePassthrough):
         
     async def __aexit__(self, exc_type, exc, tb) -> None:
         """Async context manager exit."""
-        await self.async_close()
-        
-    def __del__(self):
-        """Destructor - clean up resources."""
-        try:
-            self.close()
-        except Exception:
-            # Ignore errors during cleanup
-            pass
\ No newline at end of file
+        await self.async_close()
\ No newline at end of file
@@ -8,35 +8,46 @@ import importlib
 import os
 import sys
 import glob
+from typing import Optional
 
 _rusocks_mod = None  # type: ignore[var-annotated]
 
-# Try to import compiled module from a wheel colocated with this package
-try:
-    _pkg_dir = os.path.dirname(__file__)
-    wheel_candidates = sorted(glob.glob(os.path.join(_pkg_dir, "rusocks-*.whl")), reverse=True)
 
-    for whl in wheel_candidates:
-        # Temporarily add the wheel to sys.path to try import
-        if whl not in sys.path:
-            sys.path.insert(0, whl)
-            _added = True
-        else:
-            _added = False
+def _find_wheel(pkg_dir: str) -> Optional[str]:
+    """Return the newest colocated wheel whose tags match this interpreter, if any."""
+    candidates = sorted(glob.glob(os.path.join(pkg_dir, "rusocks-*.whl")), reverse=True)
+    if not candidates:
+        return None
+    try:
+        from packaging.tags import sys_tags
+        from packaging.utils import parse_wheel_filename
+    except ImportError:
+        # Cannot check tags without packaging; only the newest wheel is tried
+        return candidates[0]
+    supported = set(sys_tags())
+    for whl in candidates:
+        try:
+            _, _, _, tags = parse_wheel_filename(os.path.basename(whl))
+        except Exception:
+            continue
+        if not supported.isdisjoint(tags):
+            return whl
+    return None
 
+
+# Try to import compiled module from a wheel colocated with this package
+try:
+    _whl = _find_wheel(os.path.dirname(__file__))
+    if _whl is not None:
+        _added = _whl not in sys.path
+        if _added:
+            sys.path.insert(0, _whl)
         try:
             _rusocks_mod = importlib.import_module("rusockslib.rusocks")
-            break
         except Exception:
-            # Not compatible or cannot import — continue to next candidate
-            pass
-        finally:
-            # Leave path entry in place if it worked; otherwise remove what we added
-            if _added and "rusockslib.rusocks" not in sys.modules and whl in sys.path:
-                try:
-                    sys.path.remove(whl)
-                except ValueError:
-                    pass
+            # Not importable after all; undo the path entry and fall back to stub
+            if _added:
+                sys.path.remove(_whl)
 except Exception:
     # Ignore any probing errors and fall back to stub
     _rusocks_mod = None
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import json
+import collections
+import os
+import re
 import threading
 import time
-import uuid
+from base64 import urlsafe_b64encode
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # ---- Time constants (nanoseconds) ----
@@ -30,29 +32,72 @@ def cancel_global_runtime() -> None:
 
 
 # ---- Log infrastructure compatible with _bindings/python/rusocks/_base.py ----
-_LOG_ENTRIES: List[Dict[str, Any]] = []
+# Bounded like the Rust LogBuffer: once full, the oldest entries are dropped
+_LOG_MAX_ENTRIES = 10000
+_LOG_ENTRIES: "collections.deque[Dict[str, Any]]" = collections.deque(maxlen=_LOG_MAX_ENTRIES)
+# Entries discarded because the buffer was full
+_DROPPED_COUNT = 0
 _LOG_COND = threading.Condition()
+# Set by cancel_log_waiters() and cleared by reset_log_waiters(). Sticky, so a
+# cancel that lands before a waiter starts waiting is not lost.
+_LOG_CANCELLED = False
 
 
-def _push_log(logger_id: str, level: str, message: str) -> None:
+def _push_log(logger_id: str, level: int, message: str) -> None:
     """
-    Append a log entry into the shared queue. The 'message' field must be a JSON string
-    that includes "level" and "message" keys to match _emit_rust_log() expectations.
+    Append a structured log entry into the shared queue. Entries carry "level"
+    (see _LEVEL_CODE), "message" and "fields" directly, so the Python layer does
+    not re-parse JSON.
     """
-    # Serialize the payload the same way the Rust shim does
-    payload = json.dumps({"level": level, "message": message})
-    entry = {"logger_id": logger_id, "message": payload, "time": int(time.time_ns())}
+    entry = {
+        "logger_id": logger_id,
+        "level": level,
+        "message": message,
+        "fields": {},
+        "time": int(time.time_ns()),
+    }
+    global _DROPPED_COUNT
     with _LOG_COND:
+        was_empty = not _LOG_ENTRIES
+        if len(_LOG_ENTRIES) == _LOG_MAX_ENTRIES:
+            _DROPPED_COUNT += 1
         _LOG_ENTRIES.append(entry)
-        _LOG_COND.notify_all()
+        # The first waiter to wake drains the whole buffer, so waking one is enough;
+        # a non-empty buffer means a wakeup is already pending
+        if was_empty:
+            _LOG_COND.notify()
+
+
+def _push_logs_batch(logger_id: str, level: int, messages: List[str]) -> None:
+    """
+    Append several entries for one logger under a single lock acquisition and
+    wake at most one waiter.
+    """
+    if not messages:
+        return
+    now = int(time.time_ns())
+    entries = [
+        {"logger_id": logger_id, "level": level, "message": m, "fields": {}, "time": now}
+        for m in messages
+    ]
+    global _DROPPED_COUNT
+    with _LOG_COND:
+        was_empty = not _LOG_ENTRIES
+        _DROPPED_COUNT += max(0, len(_LOG_ENTRIES) + len(entries) - _LOG_MAX_ENTRIES)
+        _LOG_ENTRIES.extend(entries)
+        if was_empty:
+            _LOG_COND.notify()
 
 
-def wait_for_log_entries(timeout_ms: int) -> List[Dict[str, Any]]:
+def wait_for_log_entries(timeout_ms: Optional[int]) -> List[Dict[str, Any]]:
     """
     Block up to timeout_ms milliseconds for log entries and return a batch.
-    Returns [] on timeout, otherwise returns and clears the current buffer.
+    A timeout of 0 or None waits until entries arrive or cancel_log_waiters() is called.
+    Returns [] on timeout or cancellation, otherwise returns and clears the current buffer.
+    While cancelled (until reset_log_waiters()), returns without waiting.
     """
-    deadline = time.time() + (timeout_ms / 1000.0) if timeout_ms and timeout_ms > 0 else None
+    # Monotonic integer deadline: immune to wall-clock steps
+    deadline_ns = time.monotonic_ns() + timeout_ms * 1_000_000 if timeout_ms and timeout_ms > 0 else None
     with _LOG_COND:
         # If already have entries, return immediately
         if _LOG_ENTRIES:
@@ -61,60 +106,103 @@ def wait_for_log_entries(timeout_ms: int) -> List[Dict[str, Any]]:
             return batch
 
         # Otherwise, wait
-        while True:
-            if deadline is None:
+        while not _LOG_CANCELLED:
+            if deadline_ns is None:
                 _LOG_COND.wait()
             else:
-                remaining = deadline - time.time()
-                if remaining <= 0:
+                remaining_ns = deadline_ns - time.monotonic_ns()
+                if remaining_ns <= 0:
                     return []
-                _LOG_COND.wait(timeout=remaining)
+                _LOG_COND.wait(timeout=remaining_ns * 1e-9)
 
             if _LOG_ENTRIES:
                 batch = list(_LOG_ENTRIES)
                 _LOG_ENTRIES.clear()
                 return batch
+        return []
 
 
 def cancel_log_waiters() -> None:
     """
-    Wake all waiters (used by _stop_log_listener in Python layer).
+    Wake all waiters (used by _stop_log_listener in Python layer). Later waits
+    return immediately until reset_log_waiters() is called.
     """
+    global _LOG_CANCELLED
     with _LOG_COND:
+        _LOG_CANCELLED = True
         _LOG_COND.notify_all()
 
 
+def reset_log_waiters() -> None:
+    """
+    Clear a previous cancel_log_waiters() so waits block again.
+    """
+    global _LOG_CANCELLED
+    with _LOG_COND:
+        _LOG_CANCELLED = False
+
+
 # ---- Log level control ----
-class Level(Enum):
-    Error = "error"
-    Warn = "warn"
-    Info = "info"
-    Debug = "debug"
-    Trace = "trace"
+# Values are the verbosity order, so levels compare directly against thresholds
+class Level(IntEnum):
+    Error = 40
+    Warn = 30
+    Info = 20
+    Debug = 10
+    Trace = 5
 
 
 # Track a global level (defaults to Info)
 _global_level: Level = Level.Info
 
-_level_order = {
-    Level.Error: 40,
-    Level.Warn: 30,
-    Level.Info: 20,
-    Level.Debug: 10,
+
+# Integer level codes carried by log entries (match Rust's log::Level discriminants)
+_LEVEL_CODE = {
+    Level.Error: 1,
+    Level.Warn: 2,
+    Level.Info: 3,
+    Level.Debug: 4,
     Level.Trace: 5,
 }
 
 
+# Resolved once so the logger methods do not look up Level and _LEVEL_CODE per call
+_CODE_ERROR = _LEVEL_CODE[Level.Error]
+_CODE_WARN = _LEVEL_CODE[Level.Warn]
+_CODE_INFO = _LEVEL_CODE[Level.Info]
+_CODE_DEBUG = _LEVEL_CODE[Level.Debug]
+_CODE_TRACE = _LEVEL_CODE[Level.Trace]
+
+
+# Level values as plain ints for the per-call threshold checks
+_LVL_ERROR = int(Level.Error)
+_LVL_WARN = int(Level.Warn)
+_LVL_INFO = int(Level.Info)
+_LVL_DEBUG = int(Level.Debug)
+_LVL_TRACE = int(Level.Trace)
+# Above every level, so nothing passes
+_LVL_OFF = _LVL_ERROR + 1
+
+_global_threshold: int = int(_global_level)
+
+
 def set_logger_global_level(level: Level) -> None:
-    global _global_level
+    global _global_level, _global_threshold
     _global_level = level
+    _global_threshold = int(level)
 
 
 # ---- PythonLogger shim ----
 class PythonLogger:
+    __slots__ = ("_id", "_level", "_threshold")
+
+    # Without an explicit level a logger follows set_logger_global_level(), so records
+    # below the global threshold are never enqueued
     def __init__(self, logger_id: str, level: Optional[Level] = None):
         self._id = logger_id
-        self._level = level or Level.Info
+        self._level = level
+        # None means "use _global_threshold"
+        self._threshold: Optional[int] = int(level) if level is not None else None
 
     @staticmethod
     def new(logger_id: str) -> "PythonLogger":
@@ -126,32 +214,72 @@ class PythonLogger:
 
     def set_level(self, level: Level) -> None:
         self._level = level
-
-    def _enabled(self, level: Level) -> bool:
-        return _level_order[level] >= _level_order.get(self._level, 20)
+        self._threshold = int(level)
 
     def trace(self, message: str) -> None:
-        if self._enabled(Level.Trace):
-            _push_log(self._id, Level.Trace.value, message)
+        if _LVL_TRACE >= (self._threshold or _global_threshold):
+            _push_log(self._id, _CODE_TRACE, message)
 
     def debug(self, message: str) -> None:
-        if self._enabled(Level.Debug):
-            _push_log(self._id, Level.Debug.value, message)
+        if _LVL_DEBUG >= (self._threshold or _global_threshold):
+            _push_log(self._id, _CODE_DEBUG, message)
 
     def info(self, message: str) -> None:
-        if self._enabled(Level.Info):
-            _push_log(self._id, Level.Info.value, message)
+        if _LVL_INFO >= (self._threshold or _global_threshold):
+            _push_log(self._id, _CODE_INFO, message)
 
     def warn(self, message: str) -> None:
-        if self._enabled(Level.Warn):
-            _push_log(self._id, Level.Warn.value, message)
+        if _LVL_WARN >= (self._threshold or _global_threshold):
+            _push_log(self._id, _CODE_WARN, message)
 
     def error(self, message: str) -> None:
-        if self._enabled(Level.Error):
-            _push_log(self._id, Level.Error.value, message)
+        if _LVL_ERROR >= (self._threshold or _global_threshold):
+            _push_log(self._id, _CODE_ERROR, message)
+
+    def log_bytes(self, level: Level, message: bytes) -> None:
+        # Pre-encoded message; decoded only if the record is kept
+        if level >= (self._threshold or _global_threshold):
+            _push_log(self._id, _LEVEL_CODE[level], bytes(message).decode("utf-8", "replace"))
+
+    def log_batch(self, level: Level, messages: List[str]) -> None:
+        if level >= (self._threshold or _global_threshold):
+            _push_logs_batch(self._id, _LEVEL_CODE[level], list(messages))
+
+
+class _NullLogger(PythonLogger):
+    # Drops every record without touching the log buffer
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("")
+        self._threshold = _LVL_OFF
+
+    def set_level(self, level: Level) -> None:
+        return None
+
+
+_NULL_LOGGER = _NullLogger()
+
+
+def null_logger() -> PythonLogger:
+    return _NULL_LOGGER
 
 
 # ---- Duration parsing ----
+# Signed decimal number, optional whitespace, then the unit suffix
+_DURATION_RE = re.compile(r"([+-]?(?:\d+(?:\.\d*)?|\.\d+))\s*(\S*)")
+
+# Unit suffix -> nanoseconds
+_DURATION_UNITS = {
+    "ns": NANOSECOND,
+    "us": MICROSECOND,
+    "µs": MICROSECOND,
+    "ms": MILLISECOND,
+    "s": SECOND,
+    "m": MINUTE,
+    "h": HOUR,
+}
+
 def parse_duration(s: str) -> int:
     """
     Parse a duration string similar to the Rust implementation and return nanoseconds (int).
@@ -164,37 +292,31 @@ def parse_duration(s: str) -> int:
     if not s:
         raise ValueError("Empty duration string")
 
-    # Extract numeric part (float) and unit suffix
-    # Find first alpha char index
-    idx = 0
-    while idx < len(s) and (s[idx].isdigit() or s[idx] in "+-."):
-        idx += 1
-    num_str = s[:idx].strip()
-    unit_str: str = s[idx:].strip().lower()
-
-    if not num_str or not unit_str:
+    match = _DURATION_RE.fullmatch(s)
+    if match is None or not match.group(2):
         raise ValueError(f"Invalid duration format: {s!r}")
+    unit_str = match.group(2).lower()
+    multiplier = _DURATION_UNITS.get(unit_str)
+    if multiplier is None:
+        raise ValueError(f"Invalid duration unit: {unit_str!r}")
+    return int(float(match.group(1)) * multiplier)
 
-    val = float(num_str)
 
-    if unit_str in ("ns",):
-        return int(val)
-    if unit_str in ("us", "µs"):
-        return int(val * MICROSECOND)
-    if unit_str in ("ms",):
-        return int(val * MILLISECOND)
-    if unit_str in ("s",):
-        return int(val * SECOND)
-    if unit_str in ("m",):
-        return int(val * MINUTE)
-    if unit_str in ("h",):
-        return int(val * HOUR)
-
-    raise ValueError(f"Invalid duration unit: {unit_str!r}")
+def duration_from_secs_f64(secs: float) -> int:
+    """
+    Convert a (possibly fractional) number of seconds to nanoseconds (int).
+    Rejects negative and non-finite values, like Rust's Duration::try_from_secs_f64.
+    """
+    secs = float(secs)
+    if not (0.0 <= secs < float("inf")):
+        raise ValueError(f"Invalid duration seconds: {secs!r}")
+    return int(secs * SECOND)
 
 
 # ---- Cancellation context ----
 class ContextWithCancel:
+    __slots__ = ("_cancelled",)
+
     def __init__(self) -> None:
         self._cancelled = False
 
@@ -208,6 +330,32 @@ class ContextWithCancel:
 
 # ---- Options structs ----
 class ClientOptions:
+    __slots__ = (
+        "logger",
+        "ws_url",
+        "reverse",
+        "socks_host",
+        "socks_port",
+        "socks_username",
+        "socks_password",
+        "socks_wait_server",
+        "reconnect",
+        "reconnect_delay",
+        "buffer_size",
+        "channel_timeout",
+        "connect_timeout",
+        "threads",
+        "fast_open",
+        "upstream_proxy",
+        "upstream_username",
+        "upstream_password",
+        "no_env_proxy",
+        "user_agent",
+        "so_sndbuf",
+        "so_rcvbuf",
+        "tcp_nodelay",
+    )
+
     def __init__(self) -> None:
         # These attributes mirror what the higher-level Python code sets
         self.logger: Optional[PythonLogger] = None
@@ -230,9 +378,32 @@ class ClientOptions:
         self.upstream_password: Optional[str] = None
         self.no_env_proxy: Optional[bool] = None
         self.user_agent: Optional[str] = None
+        self.so_sndbuf: Optional[int] = None
+        self.so_rcvbuf: Optional[int] = None
+        self.tcp_nodelay: Optional[bool] = None
 
 
 class ServerOptions:
+    __slots__ = (
+        "logger",
+        "ws_host",
+        "ws_port",
+        "socks_host",
+        "port_pool",
+        "socks_wait_client",
+        "buffer_size",
+        "api_key",
+        "channel_timeout",
+        "connect_timeout",
+        "fast_open",
+        "upstream_proxy",
+        "upstream_username",
+        "upstream_password",
+        "so_sndbuf",
+        "so_rcvbuf",
+        "tcp_nodelay",
+    )
+
     def __init__(self) -> None:
         self.logger: Optional[PythonLogger] = None
         self.ws_host: Optional[str] = None
@@ -248,6 +419,26 @@ class ServerOptions:
         self.upstream_proxy: Optional[str] = None
         self.upstream_username: Optional[str] = None
         self.upstream_password: Optional[str] = None
+        self.so_sndbuf: Optional[int] = None
+        self.so_rcvbuf: Optional[int] = None
+        self.tcp_nodelay: Optional[bool] = None
+
+
+class ReverseTokenOptions:
+    __slots__ = (
+        "token",
+        "port",
+        "username",
+        "password",
+        "allow_manage_connector",
+    )
+
+    def __init__(self) -> None:
+        self.token: Optional[str] = None
+        self.port: Optional[int] = None
+        self.username: Optional[str] = None
+        self.password: Optional[str] = None
+        self.allow_manage_connector: bool = False
 
 
 # ---- Return structs resembling Rust binding objects ----
@@ -258,6 +449,16 @@ class ReverseTokenResult:
 
 
 # ---- Client/Server minimal shims ----
+def _new_token() -> str:
+    # 128 random bits, URL-safe and unpadded
+    return urlsafe_b64encode(os.urandom(16)).rstrip(b"=").decode("ascii")
+
+
+def _no_log(message: str) -> None:
+    # Stand-in for logger.info when no logger is configured
+    return None
+
+
 class Client:
     def __init__(self, token: str, options: ClientOptions) -> None:
         self._token = token
@@ -266,46 +467,75 @@ class Client:
         # Expose a few fields that higher-level code might introspect
         self.socks_port: Optional[int] = getattr(options, "socks_port", None)
         self.is_connected: bool = True  # pretend connected for tests
+        # Resolved once so close() does not re-check the logger
+        self._log_info = options.logger.info if options.logger else _no_log
 
         # Emit a small info log so the log pipeline can be exercised
-        if options.logger:
-            options.logger.info("client-initialized")
+        self._log_info("client-initialized")
 
     def wait_ready(self, ctx: Optional[ContextWithCancel], timeout_ns: int) -> None:
         # No-op: simulate immediate readiness
         return None
 
+    async def wait_ready_future(self, ctx: Optional[ContextWithCancel], timeout_ns: int) -> None:
+        # Awaitable twin of wait_ready that needs no worker thread
+        return self.wait_ready(ctx, timeout_ns)
+
     def add_connector(self, connector_token: Optional[str]) -> str:
-        return connector_token or str(uuid.uuid4())
+        return connector_token or _new_token()
 
     def close(self) -> None:
         if not self._closed:
             self._closed = True
-            if self._options.logger:
-                self._options.logger.info("client-closed")
+            self._log_info("client-closed")
 
 
 class Server:
     def __init__(self, options: ServerOptions) -> None:
         self._options = options
         self._closed = False
-        if options.logger:
-            options.logger.info("server-initialized")
+        self._log_info = options.logger.info if options.logger else _no_log
+        self._log_info("server-initialized")
 
     def wait_ready(self, ctx: Optional[ContextWithCancel], timeout_ns: int) -> None:
         # No-op
         return None
 
+    async def wait_ready_future(self, ctx: Optional[ContextWithCancel], timeout_ns: int) -> None:
+        # Awaitable twin of wait_ready that needs no worker thread
+        return self.wait_ready(ctx, timeout_ns)
+
     def add_forward_token(self, token: Optional[str]) -> str:
-        return token or str(uuid.uuid4())
+        return token or _new_token()
 
     def add_reverse_token(self, opts: Any) -> ReverseTokenResult:
-        token = getattr(opts, "token", None) or str(uuid.uuid4())
+        token = getattr(opts, "token", None) or _new_token()
         port = int(getattr(opts, "port", 0) or 0) or 1080
         return ReverseTokenResult(token=token, port=port)
 
     def add_connector_token(self, connector_token: Optional[str], reverse_token: str) -> str:
-        return connector_token or str(uuid.uuid4())
+        return connector_token or _new_token()
+
+    def add_forward_tokens(self, tokens: List[Optional[str]]) -> List[str]:
+        return [self.add_forward_token(t) for t in tokens]
+
+    def add_connector_tokens(self, pairs: List[Tuple[Optional[str], str]]) -> List[str]:
+        return [self.add_connector_token(c, r) for c, r in pairs]
+
+    def add_reverse_tokens(self, opts: List[Any]) -> List[ReverseTokenResult]:
+        return [self.add_reverse_token(o) for o in opts]
+
+    def configure_and_serve(
+        self,
+        forward_tokens: List[Optional[str]],
+        reverse_tokens: List[Any],
+        connector_tokens: List[Tuple[Optional[str], str]],
+    ) -> Tuple[List[str], List[ReverseTokenResult], List[str]]:
+        return (
+            self.add_forward_tokens(forward_tokens),
+            self.add_reverse_tokens(reverse_tokens),
+            self.add_connector_tokens(connector_tokens),
+        )
 
     def remove_token(self, token: str) -> bool:
         # Always succeed for shim
@@ -314,5 +544,4 @@ class Server:
     def close(self) -> None:
         if not self._closed:
             self._closed = True
-            if self._options.logger:
-                self._options.logger.info("server-closed")
\ No newline at end of file
+            self._log_info("server-closed")
\ No newline at end of file
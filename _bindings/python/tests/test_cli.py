@@ -0,0 +1,97 @@
+"""
+Tests for how CLI arguments reach the Server and Client constructors.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path to import rusocks
+_PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, _PACKAGE_DIR)
+
+from click.testing import CliRunner
+
+from rusocks import _cli
+
+
+class _FakeInstance:
+    """Records constructor kwargs in place of a Server or Client."""
+
+    created = []
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.closed = 0
+        _FakeInstance.created.append(self)
+
+    def add_forward_token(self, token):
+        return token
+
+    def wait_ready(self):
+        pass
+
+    def close(self):
+        self.closed += 1
+
+
+class TestCli(unittest.TestCase):
+    """Test cases for CLI option forwarding."""
+
+    def setUp(self):
+        _FakeInstance.created = []
+        patches = [
+            mock.patch.object(_cli, "Server", _FakeInstance),
+            mock.patch.object(_cli, "Client", _FakeInstance),
+            mock.patch.object(_cli, "_wait_for_shutdown", lambda: None),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _invoke(self, *args):
+        result = CliRunner().invoke(_cli.cli, list(args))
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(len(_FakeInstance.created), 1)
+        instance = _FakeInstance.created[0]
+        instance.kwargs.pop("logger", None)
+        return instance
+
+    def test_server_options(self):
+        """Test that only the set server options are passed, under their kwarg names."""
+        server = self._invoke("server", "-t", "tok", "--api", "key", "--channel-timeout", "1500ns")
+        self.assertEqual(
+            server.kwargs,
+            {"ws_host": "0.0.0.0", "ws_port": 8765, "api_key": "key", "channel_timeout": 1500},
+        )
+        self.assertEqual(server.closed, 1)
+
+    def test_client_options(self):
+        """Test that the client command passes its parameters through to Client."""
+        client = self._invoke("client", "-t", "tok", "-u", "ws://h:1", "--threads", "2")
+        self.assertEqual(client.args, ("tok",))
+        self.assertEqual(
+            client.kwargs,
+            {"ws_url": "ws://h:1", "reverse": False, "socks_host": "127.0.0.1", "socks_port": 1080, "threads": 2},
+        )
+
+    def test_provider_is_reverse_client(self):
+        """Test that provider starts a reverse client without a local SOCKS5 listener."""
+        client = self._invoke("provider", "-t", "tok", "-u", "ws://h:1", "--reconnect")
+        self.assertEqual(client.kwargs, {"ws_url": "ws://h:1", "reverse": True, "reconnect": True})
+        self.assertEqual(client.closed, 1)
+
+    def test_sigint_only_signals_shutdown(self):
+        """Test that the SIGINT handler leaves closing to the running command."""
+        self.addCleanup(_cli._shutdown.clear)
+        with mock.patch.object(_cli.console, "print"):
+            _cli._handle_sigint(2, None)
+        self.assertTrue(_cli._shutdown.is_set())
+        self.assertEqual(_FakeInstance.created, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Tests for forwarding Rust log records to Python loggers.
+"""
+
+import logging
+import sys
+import os
+import time
+import unittest
+from unittest import mock
+
+# Add parent directory to path to import rusocks
+_PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, _PACKAGE_DIR)
+
+from rusockslib import rusocks
+from rusocks import Client, _base
+from rusocks._base import BufferZerologLogger, _NullManagedLogger, _emit_rust_log, set_log_level
+
+
+class _ListHandler(logging.Handler):
+    """Collect emitted records in memory."""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestLogDispatch(unittest.TestCase):
+    """Test cases for the Rust -> Python log pipeline."""
+
+    def setUp(self):
+        self.logger = logging.getLogger(f"test_log_dispatch.{self._testMethodName}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.handler = _ListHandler()
+        self.logger.addHandler(self.handler)
+
+    def _wait_for_records(self, count, timeout=3.0):
+        deadline = time.monotonic() + timeout
+        while len(self.handler.records) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.handler.records
+
+    def test_structured_record_reaches_python_logger(self):
+        """Test that a structured record is delivered with its level and message."""
+        managed = BufferZerologLogger(self.logger, "test_structured_record")
+        try:
+            managed.rust_logger.warn("structured-warning")
+            records = self._wait_for_records(1)
+        finally:
+            managed.cleanup()
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].levelno, logging.WARNING)
+        self.assertEqual(records[0].getMessage(), "structured-warning")
+        self.assertEqual(records[0].rust, {})
+
+    def test_global_level_gates_rust_records(self):
+        """Test that set_log_level controls which records the Rust side enqueues."""
+        managed = BufferZerologLogger(self.logger, "test_global_level")
+        try:
+            managed.rust_logger.debug("dropped-at-info")
+            set_log_level(logging.DEBUG)
+            managed.rust_logger.debug("kept-at-debug")
+            records = self._wait_for_records(1)
+        finally:
+            set_log_level(logging.INFO)
+            managed.cleanup()
+
+        self.assertEqual([r.getMessage() for r in records], ["kept-at-debug"])
+
+    def test_log_batch_preserves_order(self):
+        """Test that a batch of records arrives in order at the batch level."""
+        managed = BufferZerologLogger(self.logger, "test_log_batch")
+        try:
+            managed.rust_logger.log_batch(rusocks.Level.Warn, ["one", "two", "three"])
+            records = self._wait_for_records(3)
+        finally:
+            managed.cleanup()
+
+        self.assertEqual([r.getMessage() for r in records], ["one", "two", "three"])
+        self.assertTrue(all(r.levelno == logging.WARNING for r in records))
+
+    def test_log_bytes_decodes_message(self):
+        """Test that pre-encoded messages arrive decoded."""
+        managed = BufferZerologLogger(self.logger, "test_log_bytes")
+        try:
+            managed.rust_logger.log_bytes(rusocks.Level.Info, "caf\u00e9".encode("utf-8"))
+            records = self._wait_for_records(1)
+        finally:
+            managed.cleanup()
+
+        self.assertEqual([r.getMessage() for r in records], ["caf\u00e9"])
+
+    def test_reused_logger_id_routes_to_new_logger(self):
+        """Test that re-registering a logger id is picked up by the listener."""
+        first = BufferZerologLogger(logging.getLogger("test_log_dispatch.discarded"), "test_reused_id")
+        first.rust_logger.info("to-first")
+        time.sleep(0.1)
+        first.cleanup()
+
+        second = BufferZerologLogger(self.logger, "test_reused_id")
+        try:
+            second.rust_logger.info("to-second")
+            records = self._wait_for_records(1)
+        finally:
+            second.cleanup()
+
+        self.assertEqual([r.getMessage() for r in records], ["to-second"])
+
+    def test_disabled_logger_gets_null_sink(self):
+        """Test that a logger silenced above ERROR is given a null Rust logger."""
+        self.logger.setLevel(logging.CRITICAL + 1)
+        client = Client("test_token", logger=self.logger, ws_url="ws://localhost:8765")
+        try:
+            self.assertIsInstance(client._managed_logger, _NullManagedLogger)
+            client._managed_logger.rust_logger.error("dropped")
+        finally:
+            client.close()
+
+        time.sleep(0.1)
+        self.assertEqual(self.handler.records, [])
+
+    def test_disabled_logger_without_null_binding(self):
+        """Test that bindings without null_logger fall back to the buffered logger."""
+        self.logger.setLevel(logging.CRITICAL + 1)
+        with mock.patch.object(_base, "_null_rust_logger", None):
+            managed = _base._managed_logger_for(self.logger, "test_no_null_binding")
+        try:
+            self.assertIsInstance(managed, BufferZerologLogger)
+        finally:
+            managed.cleanup()
+
+    def test_legacy_json_line(self):
+        """Test that JSON-encoded lines are still parsed, keeping extra keys."""
+        _emit_rust_log(self.logger, '{"level":"error","message":"boom","peer":"1.2.3.4"}')
+
+        record = self.handler.records[0]
+        self.assertEqual(record.levelno, logging.ERROR)
+        self.assertEqual(record.getMessage(), "boom")
+        self.assertEqual(record.rust, {"peer": "1.2.3.4"})
+
+    def test_legacy_json_bytes(self):
+        """Test that JSON lines handed over as raw bytes are decoded directly."""
+        _emit_rust_log(self.logger, b'{"level":"debug","message":"from-bytes"}')
+        _emit_rust_log(self.logger, b"plain-bytes")
+
+        self.assertEqual(self.handler.records[0].levelno, logging.DEBUG)
+        self.assertEqual(self.handler.records[0].getMessage(), "from-bytes")
+        self.assertEqual(self.handler.records[1].getMessage(), "plain-bytes")
+
+    def test_legacy_plain_line(self):
+        """Test that non-JSON lines are logged verbatim at INFO."""
+        _emit_rust_log(self.logger, "not json")
+
+        record = self.handler.records[0]
+        self.assertEqual(record.levelno, logging.INFO)
+        self.assertEqual(record.getMessage(), "not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Tests for how Client/Server keyword arguments reach the Rust options.
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import rusocks
+_PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, _PACKAGE_DIR)
+
+import rusocks
+from rusocks import Client, Server
+from rusocks._base import _Nanoseconds, _blocking_threads, _compile_option_setter, _to_duration
+
+
+class TestOptions(unittest.TestCase):
+    """Test cases for option forwarding."""
+
+    def test_default_buffer_size(self):
+        """Test that an unset buffer_size falls back to the module default."""
+        client = Client("test_token", ws_url="ws://localhost:8765")
+        server = Server()
+        try:
+            self.assertEqual(client._raw._options.buffer_size, 32 * 1024)
+            self.assertEqual(server._raw._options.buffer_size, 32 * 1024)
+        finally:
+            client.close()
+            server.close()
+
+    def test_set_default_buffer_size(self):
+        """Test that set_default_buffer_size applies to new instances only when unset."""
+        rusocks.set_default_buffer_size(16 * 1024)
+        try:
+            client = Client("test_token", ws_url="ws://localhost:8765")
+            explicit = Client("test_token", ws_url="ws://localhost:8765", buffer_size=4096)
+            self.assertEqual(client._raw._options.buffer_size, 16 * 1024)
+            self.assertEqual(explicit._raw._options.buffer_size, 4096)
+            client.close()
+            explicit.close()
+        finally:
+            rusocks.set_default_buffer_size(32 * 1024)
+
+        with self.assertRaises(ValueError):
+            rusocks.set_default_buffer_size(0)
+
+    def test_socket_buffer_defaults(self):
+        """Test that socket buffers default to 1 MiB and an explicit 0 is kept."""
+        server = Server(so_rcvbuf=0)
+        try:
+            self.assertEqual(server._raw._options.so_sndbuf, 1024 * 1024)
+            self.assertEqual(server._raw._options.so_rcvbuf, 0)
+            self.assertIs(server._raw._options.tcp_nodelay, True)
+        finally:
+            server.close()
+
+    def test_reverse_token_options_reset_between_calls(self):
+        """Test that the pooled ReverseTokenOptions does not leak fields between calls."""
+        server = Server()
+        try:
+            first = server.add_reverse_token(token="first", port=6000)
+            second = server.add_reverse_token()
+        finally:
+            server.close()
+
+        self.assertEqual((first.token, first.port), ("first", 6000))
+        self.assertNotEqual(second.token, "first")
+        self.assertNotEqual(second.port, 6000)
+
+    def test_batch_token_helpers(self):
+        """Test that the batch helpers return one token per input, in order."""
+        server = Server()
+        try:
+            forward = server.add_forward_tokens(["a", None, "c"])
+            connectors = server.add_connector_tokens([("x", "rev"), (None, "rev")])
+        finally:
+            server.close()
+
+        self.assertEqual(len(forward), 3)
+        self.assertEqual((forward[0], forward[2]), ("a", "c"))
+        self.assertTrue(forward[1])
+        self.assertEqual(connectors[0], "x")
+        self.assertEqual(len(connectors), 2)
+
+    def test_batch_token_helpers_without_batch_bindings(self):
+        """Test that the batch helpers fall back to per-token calls."""
+
+        class _PerTokenRaw:
+            def add_forward_token(self, token):
+                return token or "generated"
+
+            def add_connector_token(self, connector_token, reverse_token):
+                return connector_token or f"for-{reverse_token}"
+
+        server = Server()
+        raw = server._raw
+        server._raw = _PerTokenRaw()
+        try:
+            forward = server.add_forward_tokens(["a", None])
+            connectors = server.add_connector_tokens([("x", "rev"), (None, "rev")])
+        finally:
+            server._raw = raw
+            server.close()
+
+        self.assertEqual(forward, ["a", "generated"])
+        self.assertEqual(connectors, ["x", "for-rev"])
+
+    def test_configure_and_serve(self):
+        """Test that the fused setup call registers every token kind."""
+        server = Server()
+        try:
+            forward, reverse, connectors = server.configure_and_serve(
+                forward_tokens=["fwd"],
+                reverse_tokens=[{"token": "rev", "port": 9870}],
+                connector_tokens=[("conn", "rev")],
+            )
+        finally:
+            server.close()
+
+        self.assertEqual(forward, ["fwd"])
+        self.assertEqual([(r.token, r.port) for r in reverse], [("rev", 9870)])
+        self.assertEqual(connectors, ["conn"])
+
+    def test_configure_and_serve_without_fused_binding(self):
+        """Test that configure_and_serve falls back to per-call adds and wait_ready."""
+        calls = []
+
+        class _Result:
+            def __init__(self, token, port):
+                self.token, self.port = token, port
+
+        class _PerCallRaw:
+            def add_forward_token(self, token):
+                calls.append(("forward", token))
+                return token
+
+            def add_reverse_token(self, opts):
+                calls.append(("reverse", opts.token))
+                return _Result(opts.token, opts.port)
+
+            def add_connector_token(self, connector_token, reverse_token):
+                calls.append(("connector", connector_token))
+                return connector_token
+
+            def wait_ready(self, ctx, timeout):
+                calls.append(("wait_ready", timeout))
+
+        server = Server()
+        raw = server._raw
+        server._raw = _PerCallRaw()
+        try:
+            forward, reverse, connectors = server.configure_and_serve(
+                forward_tokens=["fwd"],
+                reverse_tokens=[{"token": "rev", "port": 9870}],
+                connector_tokens=[("conn", "rev")],
+            )
+        finally:
+            server._raw = raw
+            server.close()
+
+        self.assertEqual(forward, ["fwd"])
+        self.assertEqual([(r.token, r.port) for r in reverse], [("rev", 9870)])
+        self.assertEqual(connectors, ["conn"])
+        self.assertEqual(
+            calls,
+            [("forward", "fwd"), ("reverse", "rev"), ("connector", "conn"), ("wait_ready", 0)],
+        )
+
+    def test_compiled_option_setter(self):
+        """Test that the generated setter skips None and applies coercers."""
+        setter = _compile_option_setter((("name", None), ("port", int), ("fast", bool)), "_apply_test")
+
+        class _Opts:
+            name = "unset"
+
+        opt = _Opts()
+        setter(opt, {"name": None, "port": "8080", "fast": 1})
+        self.assertEqual(opt.name, "unset")
+        self.assertEqual(opt.port, 8080)
+        self.assertIs(opt.fast, True)
+
+    def test_parsed_nanoseconds_pass_through(self):
+        """Test that pre-parsed nanoseconds are not rescaled like bare seconds."""
+        self.assertEqual(_to_duration(_Nanoseconds(1500)), 1500)
+        self.assertEqual(_to_duration(1500), 1500 * 1_000_000_000)
+
+    def test_blocking_threads_env(self):
+        """Test that RUSOCKS_BLOCKING_THREADS is honoured and bad values fall back."""
+        default = min(32, (os.cpu_count() or 1) + 4)
+        saved = os.environ.get("RUSOCKS_BLOCKING_THREADS")
+        try:
+            os.environ["RUSOCKS_BLOCKING_THREADS"] = "7"
+            self.assertEqual(_blocking_threads(), 7)
+            for bad in ("many", "0", "-2"):
+                os.environ["RUSOCKS_BLOCKING_THREADS"] = bad
+                self.assertEqual(_blocking_threads(), default)
+            del os.environ["RUSOCKS_BLOCKING_THREADS"]
+            self.assertEqual(_blocking_threads(), default)
+        finally:
+            if saved is None:
+                os.environ.pop("RUSOCKS_BLOCKING_THREADS", None)
+            else:
+                os.environ["RUSOCKS_BLOCKING_THREADS"] = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,16 @@ Tests for the rusockslib Python bindings.
 import unittest
 import sys
 import os
+import json
+import subprocess
+import textwrap
+import threading
 from pathlib import Path
 
 # Add the parent directory to the path so we can import rusockslib
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_PACKAGE_DIR = str(Path(__file__).parent.parent)
+if _PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, _PACKAGE_DIR)
 
 from rusockslib import rusocks
 
@@ -78,5 +84,94 @@ class TestRusocksLib(unittest.TestCase):
         # Cancel log waiters
         rusocks.cancel_log_waiters()
 
+    def test_cancel_wakes_blocking_waiter(self):
+        """Test that cancel_log_waiters unblocks a wait without timeout."""
+        rusocks.reset_log_waiters()
+        self.addCleanup(rusocks.reset_log_waiters)
+        rusocks.wait_for_log_entries(10)  # drain anything left by other tests
+        result = []
+        started = threading.Event()
+
+        def wait():
+            started.set()
+            result.append(rusocks.wait_for_log_entries(0))
+
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        self.assertTrue(started.wait(timeout=5))
+
+        # Cancellation is sticky, so the waiter is released whether or not it
+        # has blocked yet
+        rusocks.cancel_log_waiters()
+        waiter.join(timeout=5)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(result, [[]])
+
+    def test_push_wakes_single_waiter(self):
+        """Test that one log entry is handed to exactly one blocked waiter."""
+        # A fresh interpreter keeps the package log listener from competing
+        # for the entry
+        script = textwrap.dedent(
+            """
+            import json, sys, threading
+            sys.path.insert(0, sys.argv[1])
+            from rusockslib import rusocks
+
+            results = []
+            delivered = threading.Event()
+
+            def wait():
+                batch = rusocks.wait_for_log_entries(0)
+                results.append([entry["message"] for entry in batch])
+                if batch:
+                    delivered.set()
+
+            waiters = [threading.Thread(target=wait) for _ in range(2)]
+            for waiter in waiters:
+                waiter.start()
+            rusocks.PythonLogger.new("test").info("hello")
+            got_entry = delivered.wait(timeout=5)
+            before_cancel = list(results)
+
+            rusocks.cancel_log_waiters()
+            for waiter in waiters:
+                waiter.join(timeout=5)
+            print(json.dumps({
+                "delivered": got_entry,
+                "before_cancel": before_cancel,
+                "results": sorted(results),
+                "alive": any(waiter.is_alive() for waiter in waiters),
+            }))
+            """
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", script, _PACKAGE_DIR],
+            capture_output=True, text=True, timeout=30,
+        )
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        outcome = json.loads(proc.stdout)
+
+        # Only the waiter holding the entry returns before cancellation; the
+        # other stays blocked until cancel_log_waiters()
+        self.assertTrue(outcome["delivered"])
+        self.assertEqual(outcome["before_cancel"], [["hello"]])
+        self.assertEqual(outcome["results"], [[], ["hello"]])
+        self.assertFalse(outcome["alive"])
+
+    def test_cancel_before_wait_is_not_lost(self):
+        """Test that a cancel issued before a waiter blocks still releases it."""
+        rusocks.reset_log_waiters()
+        self.addCleanup(rusocks.reset_log_waiters)
+        rusocks.wait_for_log_entries(10)  # drain anything left by other tests
+        rusocks.cancel_log_waiters()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(rusocks.wait_for_log_entries(0)))
+        waiter.start()
+        waiter.join(timeout=2)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(result, [[]])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -10,7 +10,9 @@ import sys
 import os
 
 # Add parent directory to path to import rusocks
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+_PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, _PACKAGE_DIR)
 
 from rusocks import Client
 
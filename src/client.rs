@@ -84,6 +84,15 @@ pub struct ClientOption {
 
     /// Custom User-Agent header for WebSocket connections
     pub user_agent: Option<String>,
+
+    /// SO_SNDBUF for proxied TCP connections (0 keeps the system default)
+    pub so_sndbuf: u32,
+
+    /// SO_RCVBUF for proxied TCP connections (0 keeps the system default)
+    pub so_rcvbuf: u32,
+
+    /// Whether to disable Nagle's algorithm on proxied TCP connections
+    pub tcp_nodelay: bool,
 }
 
 impl Default for ClientOption {
@@ -107,6 +116,9 @@ impl Default for ClientOption {
             upstream_password: None,
             no_env_proxy: false,
             user_agent: None,
+            so_sndbuf: 0,
+            so_rcvbuf: 0,
+            tcp_nodelay: true,
         }
     }
 }
@@ -214,6 +226,19 @@ impl ClientOption {
         self.user_agent = Some(user_agent);
         self
     }
+
+    /// Set the socket send/receive buffer sizes (0 keeps the system default)
+    pub fn with_socket_buffers(mut self, sndbuf: u32, rcvbuf: u32) -> Self {
+        self.so_sndbuf = sndbuf;
+        self.so_rcvbuf = rcvbuf;
+        self
+    }
+
+    /// Set whether to disable Nagle's algorithm
+    pub fn with_tcp_nodelay(mut self, nodelay: bool) -> Self {
+        self.tcp_nodelay = nodelay;
+        self
+    }
 }
 
 /// Channel state
@@ -409,15 +434,21 @@ impl LinkSocksClient {
                 let socks_port = self.options.socks_port;
                 let pending = self.pending_connect.clone();
                 let writers = self.channel_streams.clone();
+                let tcp_nodelay = self.options.tcp_nodelay;
+                let (so_sndbuf, so_rcvbuf) = (self.options.so_sndbuf, self.options.so_rcvbuf);
                 tokio::spawn(async move {
                     let addr = format!("{}:{}", socks_host, socks_port);
-                    match TcpListener::bind(&addr).await {
+                    match crate::relay::bind_tcp_listener(addr.as_str(), so_sndbuf, so_rcvbuf).await
+                    {
                         Ok(listener) => {
                             log::info!("SOCKS5 server listening on {}", addr);
                             loop {
                                 match listener.accept().await {
                                     Ok((stream, peer)) => {
                                         log::debug!("SOCKS accepted from {}", peer);
+                                        if tcp_nodelay {
+                                            let _ = stream.set_nodelay(true);
+                                        }
                                         let ws_tx = ws_tx.clone();
                                         let pending = pending.clone();
                                         let writers = writers.clone();
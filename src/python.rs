@@ -4,6 +4,7 @@ use log::{Level, LevelFilter};
 use serde::{Deserialize, Serialize};
 use std::collections::VecDeque;
 use std::fmt;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::{Arc, Mutex};
 use std::time::{Duration, SystemTime, UNIX_EPOCH};
 use tokio::runtime::Runtime;
@@ -21,6 +22,16 @@ lazy_static::lazy_static! {
     static ref LOG_BUFFER: Mutex<LogBuffer> = Mutex::new(LogBuffer::new());
 }
 
+// Level set via `set_logger_global_level`, stored as a `LevelFilter` value.
+// Kept separate from `log::max_level()`, which stays `Off` unless a `log`
+// backend is installed, so library users still get Info records by default.
+static GLOBAL_LOG_LEVEL: AtomicUsize = AtomicUsize::new(LevelFilter::Info as usize);
+
+/// Whether `level` passes the level set via `set_logger_global_level`
+fn global_level_enabled(level: Level) -> bool {
+    level as usize <= GLOBAL_LOG_LEVEL.load(Ordering::Relaxed)
+}
+
 /// Initialize the global runtime
 pub fn init_global_runtime() {
     let mut runtime = GLOBAL_RUNTIME.lock().unwrap();
@@ -149,22 +160,37 @@ pub fn parse_duration(s: &str) -> Result<Duration, String> {
     Ok(result)
 }
 
+/// Convert a (possibly fractional) number of seconds to a duration
+pub fn duration_from_secs_f64(secs: f64) -> Result<Duration, String> {
+    Duration::try_from_secs_f64(secs).map_err(|e| e.to_string())
+}
+
 /// Log entry for Python bindings
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct LogEntry {
     /// Logger ID
     pub logger_id: String,
 
+    /// Log level (`log::Level` discriminant: 1 = error ... 5 = trace)
+    pub level: u8,
+
     /// Log message
     pub message: String,
 
+    /// Structured fields attached to the record
+    pub fields: Vec<(String, String)>,
+
     /// Timestamp (Unix timestamp in nanoseconds)
     pub time: u64,
 }
 
 impl fmt::Display for LogEntry {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        write!(f, "[{}] {}: {}", self.time, self.logger_id, self.message)
+        write!(
+            f,
+            "[{}] {} {}: {}",
+            self.time, self.logger_id, self.level, self.message
+        )
     }
 }
 
@@ -172,7 +198,11 @@ impl fmt::Display for LogEntry {
 struct LogBuffer {
     entries: VecDeque<LogEntry>,
     max_size: usize,
-    notify_channels: Vec<mpsc::Sender<()>>,
+    notify_channels: Vec<(u64, mpsc::Sender<()>)>,
+    next_channel_id: u64,
+    // Set by cancel_log_waiters, cleared by reset_log_waiters; sticky so a
+    // cancel that lands before a waiter registers is not lost
+    cancelled: bool,
 }
 
 impl LogBuffer {
@@ -182,14 +212,34 @@ impl LogBuffer {
             entries: VecDeque::new(),
             max_size: 10000,
             notify_channels: Vec::new(),
+            next_channel_id: 0,
+            cancelled: false,
         }
     }
 
     /// Add a log entry to the buffer
-    fn add_entry(&mut self, logger_id: &str, message: &str) {
+    fn add_entry(&mut self, logger_id: &str, level: Level, message: &str) {
+        self.push_entry(logger_id, level, message);
+        self.notify();
+    }
+
+    /// Add several entries for one logger, waking listeners once
+    fn add_entries(&mut self, logger_id: &str, level: Level, messages: &[&str]) {
+        for message in messages {
+            self.push_entry(logger_id, level, message);
+        }
+        if !messages.is_empty() {
+            self.notify();
+        }
+    }
+
+    /// Append an entry without notifying listeners
+    fn push_entry(&mut self, logger_id: &str, level: Level, message: &str) {
         let entry = LogEntry {
             logger_id: logger_id.to_string(),
+            level: level as u8,
             message: message.to_string(),
+            fields: Vec::new(),
             time: SystemTime::now()
                 .duration_since(UNIX_EPOCH)
                 .unwrap()
@@ -202,9 +252,11 @@ impl LogBuffer {
         while self.entries.len() > self.max_size {
             self.entries.pop_front();
         }
+    }
 
-        // Notify all waiting listeners
-        for channel in &self.notify_channels {
+    /// Notify all waiting listeners
+    fn notify(&self) {
+        for (_, channel) in &self.notify_channels {
             let _ = channel.try_send(());
         }
     }
@@ -215,23 +267,31 @@ impl LogBuffer {
         entries
     }
 
-    /// Register a notification channel
-    fn register_channel(&mut self, channel: mpsc::Sender<()>) {
-        self.notify_channels.push(channel);
+    /// Register a notification channel and return its id
+    fn register_channel(&mut self, channel: mpsc::Sender<()>) -> u64 {
+        let id = self.next_channel_id;
+        self.next_channel_id += 1;
+        self.notify_channels.push((id, channel));
+        id
     }
 
-    /// Unregister a notification channel
-    fn unregister_channel(&mut self, index: usize) {
-        if index < self.notify_channels.len() {
-            self.notify_channels.remove(index);
-        }
+    /// Unregister the notification channel with the given id
+    fn unregister_channel(&mut self, id: u64) {
+        self.notify_channels
+            .retain(|(channel_id, _)| *channel_id != id);
     }
 }
 
 /// Add a log entry to the global buffer
-pub fn add_log_entry(logger_id: &str, message: &str) {
+pub fn add_log_entry(logger_id: &str, level: Level, message: &str) {
+    let mut buffer = LOG_BUFFER.lock().unwrap();
+    buffer.add_entry(logger_id, level, message);
+}
+
+/// Add several log entries to the global buffer under a single lock
+pub fn add_log_entries(logger_id: &str, level: Level, messages: &[&str]) {
     let mut buffer = LOG_BUFFER.lock().unwrap();
-    buffer.add_entry(logger_id, message);
+    buffer.add_entries(logger_id, level, messages);
 }
 
 /// Get log entries from the global buffer
@@ -241,33 +301,32 @@ pub fn get_log_entries() -> Vec<LogEntry> {
 }
 
 /// Wait for log entries with timeout (in milliseconds)
+///
+/// A timeout of 0 waits until entries arrive or `cancel_log_waiters` is
+/// called. Returns immediately with no entries while cancelled.
 pub async fn wait_for_log_entries(timeout_ms: u64) -> Vec<LogEntry> {
-    // First, check if there are already entries available
-    {
+    // Check for entries and register under one lock, so an entry pushed in
+    // between cannot slip past without a wakeup
+    let (notify_tx, mut notify_rx) = mpsc::channel(1);
+    let id = {
         let mut buffer = LOG_BUFFER.lock().unwrap();
         if !buffer.entries.is_empty() {
             return buffer.get_entries();
         }
-    }
-
-    // Create a notification channel for this listener
-    let (notify_tx, mut notify_rx) = mpsc::channel(1);
-
-    // Register the channel
-    let index;
-    {
-        let mut buffer = LOG_BUFFER.lock().unwrap();
-        buffer.register_channel(notify_tx);
-        index = buffer.notify_channels.len() - 1;
-    }
+        if buffer.cancelled {
+            return Vec::new();
+        }
+        buffer.register_channel(notify_tx)
+    };
 
     // Cleanup function to remove the channel
     let cleanup = || {
         let mut buffer = LOG_BUFFER.lock().unwrap();
-        buffer.unregister_channel(index);
+        buffer.unregister_channel(id);
     };
 
-    // Wait for notification or timeout
+    // Wait for notification or timeout; cancellation drops our sender,
+    // which also ends recv()
     if timeout_ms > 0 {
         tokio::select! {
             _ = notify_rx.recv() => {
@@ -290,15 +349,24 @@ pub async fn wait_for_log_entries(timeout_ms: u64) -> Vec<LogEntry> {
 }
 
 /// Cancel all waiting log listeners
+///
+/// Stays in effect for later waits until `reset_log_waiters` is called.
 pub fn cancel_log_waiters() {
     let mut buffer = LOG_BUFFER.lock().unwrap();
+    buffer.cancelled = true;
     buffer.notify_channels.clear();
 }
 
+/// Clear a previous `cancel_log_waiters` so waits block again
+pub fn reset_log_waiters() {
+    let mut buffer = LOG_BUFFER.lock().unwrap();
+    buffer.cancelled = false;
+}
+
 /// Logger for Python bindings
 pub struct PythonLogger {
     id: String,
-    level: Level,
+    level: LevelFilter,
 }
 
 impl PythonLogger {
@@ -306,7 +374,7 @@ impl PythonLogger {
     pub fn new(id: &str) -> Self {
         PythonLogger {
             id: id.to_string(),
-            level: Level::Info,
+            level: LevelFilter::Info,
         }
     }
 
@@ -314,24 +382,48 @@ impl PythonLogger {
     pub fn new_with_level(id: &str, level: Level) -> Self {
         PythonLogger {
             id: id.to_string(),
-            level,
+            level: level.to_level_filter(),
+        }
+    }
+
+    /// Create a logger that drops every record without touching the log buffer
+    pub fn null() -> Self {
+        PythonLogger {
+            id: String::new(),
+            level: LevelFilter::Off,
         }
     }
 
     /// Set the log level
     pub fn set_level(&mut self, level: Level) {
-        self.level = level;
+        self.level = level.to_level_filter();
     }
 
     /// Log a message at the specified level
+    ///
+    /// Records more verbose than either this logger's level or the global
+    /// level set via `set_logger_global_level` are dropped before buffering.
     pub fn log(&self, level: Level, message: &str) {
-        if level >= self.level {
-            let formatted = format!(
-                "{{\"level\":\"{}\",\"message\":\"{}\"}}",
-                level.as_str(),
-                message
-            );
-            add_log_entry(&self.id, &formatted);
+        if level <= self.level && global_level_enabled(level) {
+            add_log_entry(&self.id, level, message);
+        }
+    }
+
+    /// Log several messages at one level with a single buffer lock
+    pub fn log_batch(&self, level: Level, messages: &[&str]) {
+        if level <= self.level && global_level_enabled(level) {
+            add_log_entries(&self.id, level, messages);
+        }
+    }
+
+    /// Log a UTF-8 encoded message at the specified level
+    ///
+    /// Lets callers hand over pre-encoded bytes; the message is only decoded
+    /// once it passes the level check, and valid UTF-8 is borrowed rather than
+    /// copied. Invalid sequences are replaced with U+FFFD.
+    pub fn log_bytes(&self, level: Level, message: &[u8]) {
+        if level <= self.level && global_level_enabled(level) {
+            add_log_entry(&self.id, level, &String::from_utf8_lossy(message));
         }
     }
 
@@ -361,6 +453,11 @@ impl PythonLogger {
     }
 }
 
+/// A logger for callers whose Python side discards all records
+pub fn null_logger() -> PythonLogger {
+    PythonLogger::null()
+}
+
 /// Set the global log level
 pub fn set_logger_global_level(level: Level) {
     // Convert Level to LevelFilter manually since from_level is not available
@@ -371,5 +468,6 @@ pub fn set_logger_global_level(level: Level) {
         Level::Debug => LevelFilter::Debug,
         Level::Trace => LevelFilter::Trace,
     };
+    GLOBAL_LOG_LEVEL.store(level_filter as usize, Ordering::Relaxed);
     log::set_max_level(level_filter);
 }
@@ -10,7 +10,7 @@ use std::sync::Arc;
 use std::time::Duration;
 use tokio::io::{AsyncReadExt, AsyncWriteExt};
 use tokio::net::tcp::{OwnedReadHalf, OwnedWriteHalf};
-use tokio::net::TcpStream;
+use tokio::net::{TcpListener, TcpSocket, TcpStream, ToSocketAddrs};
 use tokio::sync::{mpsc, Mutex, RwLock};
 use tokio::time::timeout;
 use tokio_tungstenite::tungstenite::Message as WsMessage;
@@ -48,6 +48,15 @@ pub struct RelayOption {
 
     /// Upstream SOCKS5 proxy password
     pub upstream_password: Option<String>,
+
+    /// SO_SNDBUF for outbound connections (0 keeps the system default)
+    pub so_sndbuf: u32,
+
+    /// SO_RCVBUF for outbound connections (0 keeps the system default)
+    pub so_rcvbuf: u32,
+
+    /// Whether to disable Nagle's algorithm on outbound connections
+    pub tcp_nodelay: bool,
 }
 
 impl Default for RelayOption {
@@ -60,6 +69,9 @@ impl Default for RelayOption {
             upstream_proxy: None,
             upstream_username: None,
             upstream_password: None,
+            so_sndbuf: 0,
+            so_rcvbuf: 0,
+            tcp_nodelay: true,
         }
     }
 }
@@ -101,6 +113,91 @@ impl RelayOption {
         self.upstream_password = Some(password);
         self
     }
+
+    /// Set the socket send/receive buffer sizes (0 keeps the system default)
+    pub fn with_socket_buffers(mut self, sndbuf: u32, rcvbuf: u32) -> Self {
+        self.so_sndbuf = sndbuf;
+        self.so_rcvbuf = rcvbuf;
+        self
+    }
+
+    /// Set whether to disable Nagle's algorithm
+    pub fn with_tcp_nodelay(mut self, nodelay: bool) -> Self {
+        self.tcp_nodelay = nodelay;
+        self
+    }
+}
+
+/// Connect to `addr`, sizing the socket buffers before the handshake so the
+/// TCP window scale is negotiated for them
+async fn connect_tcp(addr: SocketAddr, options: &RelayOption) -> std::io::Result<TcpStream> {
+    let stream = if options.so_sndbuf == 0 && options.so_rcvbuf == 0 {
+        TcpStream::connect(addr).await?
+    } else {
+        let socket = if addr.is_ipv4() {
+            TcpSocket::new_v4()?
+        } else {
+            TcpSocket::new_v6()?
+        };
+        if options.so_sndbuf > 0 {
+            socket.set_send_buffer_size(options.so_sndbuf)?;
+        }
+        if options.so_rcvbuf > 0 {
+            socket.set_recv_buffer_size(options.so_rcvbuf)?;
+        }
+        socket.connect(addr).await?
+    };
+    if options.tcp_nodelay {
+        stream.set_nodelay(true)?;
+    }
+    Ok(stream)
+}
+
+/// Bind a listener whose accepted sockets use the given buffer sizes
+///
+/// Accepted sockets inherit SO_SNDBUF/SO_RCVBUF from the listener, and setting
+/// them before `listen` lets the window scale be negotiated for them. Both
+/// sizes 0 is a plain `TcpListener::bind`.
+pub(crate) async fn bind_tcp_listener<A: ToSocketAddrs>(
+    addr: A,
+    sndbuf: u32,
+    rcvbuf: u32,
+) -> std::io::Result<TcpListener> {
+    if sndbuf == 0 && rcvbuf == 0 {
+        return TcpListener::bind(addr).await;
+    }
+    let mut last_err = None;
+    for addr in tokio::net::lookup_host(addr).await? {
+        match bind_sized_listener(addr, sndbuf, rcvbuf) {
+            Ok(listener) => return Ok(listener),
+            Err(e) => last_err = Some(e),
+        }
+    }
+    Err(last_err.unwrap_or_else(|| {
+        std::io::Error::new(
+            std::io::ErrorKind::InvalidInput,
+            "could not resolve to any address",
+        )
+    }))
+}
+
+fn bind_sized_listener(addr: SocketAddr, sndbuf: u32, rcvbuf: u32) -> std::io::Result<TcpListener> {
+    let socket = if addr.is_ipv4() {
+        TcpSocket::new_v4()?
+    } else {
+        TcpSocket::new_v6()?
+    };
+    // Match TcpListener::bind, which sets SO_REUSEADDR outside Windows
+    #[cfg(not(windows))]
+    socket.set_reuseaddr(true)?;
+    if sndbuf > 0 {
+        socket.set_send_buffer_size(sndbuf)?;
+    }
+    if rcvbuf > 0 {
+        socket.set_recv_buffer_size(rcvbuf)?;
+    }
+    socket.bind(addr)?;
+    socket.listen(1024)
 }
 
 /// Channel state
@@ -231,7 +328,11 @@ impl Relay {
         };
 
         // Connect with timeout
-        let connect_result = timeout(self.options.connect_timeout, TcpStream::connect(addr)).await;
+        let connect_result = timeout(
+            self.options.connect_timeout,
+            connect_tcp(addr, &self.options),
+        )
+        .await;
 
         match connect_result {
             Ok(Ok(stream)) => {
@@ -133,6 +133,15 @@ pub struct ServerOption {
 
     /// Upstream SOCKS5 proxy password
     pub upstream_password: Option<String>,
+
+    /// SO_SNDBUF for proxied TCP connections (0 keeps the system default)
+    pub so_sndbuf: u32,
+
+    /// SO_RCVBUF for proxied TCP connections (0 keeps the system default)
+    pub so_rcvbuf: u32,
+
+    /// Whether to disable Nagle's algorithm on proxied TCP connections
+    pub tcp_nodelay: bool,
 }
 
 impl Default for ServerOption {
@@ -151,6 +160,9 @@ impl Default for ServerOption {
             upstream_proxy: None,
             upstream_username: None,
             upstream_password: None,
+            so_sndbuf: 0,
+            so_rcvbuf: 0,
+            tcp_nodelay: true,
         }
     }
 }
@@ -228,6 +240,19 @@ impl ServerOption {
         self.upstream_password = Some(password);
         self
     }
+
+    /// Set the socket send/receive buffer sizes (0 keeps the system default)
+    pub fn with_socket_buffers(mut self, sndbuf: u32, rcvbuf: u32) -> Self {
+        self.so_sndbuf = sndbuf;
+        self.so_rcvbuf = rcvbuf;
+        self
+    }
+
+    /// Set whether to disable Nagle's algorithm
+    pub fn with_tcp_nodelay(mut self, nodelay: bool) -> Self {
+        self.tcp_nodelay = nodelay;
+        self
+    }
 }
 
 /// Options for reverse token
@@ -595,6 +620,45 @@ impl LinkSocksServer {
         Ok(connector_token)
     }
 
+    /// Add several forward tokens in one call, stopping at the first failure
+    pub async fn add_forward_tokens(
+        &self,
+        tokens: Vec<Option<String>>,
+    ) -> Result<Vec<String>, String> {
+        let mut added = Vec::with_capacity(tokens.len());
+        for token in tokens {
+            added.push(self.add_forward_token(token).await?);
+        }
+        Ok(added)
+    }
+
+    /// Add several reverse tokens in one call, stopping at the first failure
+    pub async fn add_reverse_tokens(
+        &self,
+        opts: Vec<ReverseTokenOptions>,
+    ) -> Result<Vec<ReverseTokenResult>, String> {
+        let mut added = Vec::with_capacity(opts.len());
+        for opt in opts {
+            added.push(self.add_reverse_token(opt).await?);
+        }
+        Ok(added)
+    }
+
+    /// Add several (connector, reverse) token pairs in one call, stopping at the first failure
+    pub async fn add_connector_tokens(
+        &self,
+        pairs: Vec<(Option<String>, String)>,
+    ) -> Result<Vec<String>, String> {
+        let mut added = Vec::with_capacity(pairs.len());
+        for (connector_token, reverse_token) in pairs {
+            added.push(
+                self.add_connector_token(connector_token, &reverse_token)
+                    .await?,
+            );
+        }
+        Ok(added)
+    }
+
     /// Remove a token
     pub async fn remove_token(&self, token: &str) -> bool {
         let mut removed = false;
@@ -675,7 +739,13 @@ impl LinkSocksServer {
             }
         }
 
-        let listener = TcpListener::bind(self.ws_addr).await.map_err(|e| {
+        let listener = crate::relay::bind_tcp_listener(
+            self.ws_addr,
+            self.options.so_sndbuf,
+            self.options.so_rcvbuf,
+        )
+        .await
+        .map_err(|e| {
             format!(
                 "Failed to bind WebSocket listener on {}: {}",
                 self.ws_addr, e
@@ -701,6 +771,9 @@ impl LinkSocksServer {
                         match accept_res {
                             Ok((stream, addr)) => {
                                 debug!("Accepted WebSocket connection from {}", addr);
+                                if server.options.tcp_nodelay {
+                                    let _ = stream.set_nodelay(true);
+                                }
                                 let session_server = server.clone();
                                 tokio::spawn(async move {
                                     if let Err(err) = session_server.handle_ws_connection(stream, addr).await {
@@ -737,6 +810,23 @@ impl LinkSocksServer {
         Ok(())
     }
 
+    /// Register forward, reverse and connector tokens, then start the server
+    ///
+    /// Reverse tokens are added before connector tokens so connectors may refer
+    /// to reverse tokens from the same call. Stops at the first failure.
+    pub async fn configure_and_serve(
+        &self,
+        forward_tokens: Vec<Option<String>>,
+        reverse_tokens: Vec<ReverseTokenOptions>,
+        connector_tokens: Vec<(Option<String>, String)>,
+    ) -> Result<(Vec<String>, Vec<ReverseTokenResult>, Vec<String>), String> {
+        let forward = self.add_forward_tokens(forward_tokens).await?;
+        let reverse = self.add_reverse_tokens(reverse_tokens).await?;
+        let connector = self.add_connector_tokens(connector_tokens).await?;
+        self.serve().await?;
+        Ok((forward, reverse, connector))
+    }
+
     /// Wait for the server to be ready
     pub async fn wait_ready(&self) -> Result<(), String> {
         self.serve().await?;
@@ -759,7 +849,11 @@ impl LinkSocksServer {
         debug!("WebSocket handshake completed for {}", addr);
 
         // Relay for forward mode (server-side network dialer)
-        let relay = crate::relay::Relay::new_default();
+        let relay = crate::relay::Relay::new(
+            crate::relay::RelayOption::default()
+                .with_socket_buffers(self.options.so_sndbuf, self.options.so_rcvbuf)
+                .with_tcp_nodelay(self.options.tcp_nodelay),
+        );
 
         let (ws_sender_init, mut ws_receiver) = ws_stream.split();
         let mut ws_sender_opt = Some(ws_sender_init);
@@ -1371,7 +1465,13 @@ impl LinkSocksServer {
             .await
             .map_err(|e| format!("Failed to allocate socket address for port {}: {}", port, e))?;
 
-        let listener = match TcpListener::bind(addr).await {
+        let listener = match crate::relay::bind_tcp_listener(
+            addr,
+            self.options.so_sndbuf,
+            self.options.so_rcvbuf,
+        )
+        .await
+        {
             Ok(listener) => listener,
             Err(err) => {
                 self.socket_manager.release_socket(port).await;
@@ -1400,6 +1500,9 @@ impl LinkSocksServer {
                         match accept_res {
                             Ok((stream, addr)) => {
                                 debug!("Accepted reverse SOCKS connection for token {} from {}", token_label, addr);
+                                if server_clone.options.tcp_nodelay {
+                                    let _ = stream.set_nodelay(true);
+                                }
                                 let server_clone2 = server_clone.clone();
                                 let token_use = token_label.clone();
                                 tokio::spawn(async move {